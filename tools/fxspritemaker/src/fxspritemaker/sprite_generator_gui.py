@@ -10,16 +10,32 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QHBoxLayout, QLabel, QSlider, QComboBox, QPushButton,
                                QSpinBox, QGroupBox, QFileDialog, QMessageBox, QLineEdit,
                                QCheckBox, QColorDialog, QSizePolicy, QMenu)
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QImage, QPixmap, QColor, QAction
+from PySide6.QtCore import Qt, QThread, Signal, QTimer, QRect
+from PySide6.QtGui import QImage, QPixmap, QColor, QAction, QPainter
 import os
+import re
 from .sprite_generator import SpriteGenerator
 from .version import VERSION
 
+# Optional: direct libpng encoder (falls back to Pillow when not installed)
+try:
+    import imagecodecs
+except ImportError:
+    imagecodecs = None
+
+
+def save_png(rgba, filepath):
+    """Save an RGBA uint8 array as PNG, bypassing PIL.Image when possible."""
+    if imagecodecs is not None:
+        with open(filepath, 'wb') as f:
+            f.write(imagecodecs.png_encode(rgba, level=1))
+    else:
+        Image.fromarray(rgba, mode='RGBA').save(filepath, 'PNG')
+
 
 class SpriteGeneratorThread(QThread):
     """Background thread for sprite generation."""
-    finished = Signal(np.ndarray)
+    finished = Signal(object)  # ndarray passed by reference, no marshalling copy
     
     def __init__(self, sprite_type, width, height, params):
         super().__init__()
@@ -43,6 +59,41 @@ class SpriteGeneratorThread(QThread):
             self.finished.emit(np.zeros((self.height, self.width, 4), dtype=np.uint8))
 
 
+class ImagePreviewLabel(QLabel):
+    """Label that paints a QImage directly, scaled down to fit at paint time."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._image = None
+    
+    def set_image(self, image):
+        """Set the image to display and schedule a repaint."""
+        self._image = image
+        self.update()
+    
+    def paintEvent(self, event):
+        """Draw frame/background, then the image centered and scaled to fit."""
+        super().paintEvent(event)
+        if self._image is None or self._image.isNull():
+            return
+        
+        rect = self.contentsRect()
+        img_w, img_h = self._image.width(), self._image.height()
+        
+        # Only scale down, never up (max 100%)
+        factor = min(1.0, rect.width() / img_w, rect.height() / img_h)
+        draw_w = int(img_w * factor)
+        draw_h = int(img_h * factor)
+        target = QRect(rect.x() + (rect.width() - draw_w) // 2,
+                       rect.y() + (rect.height() - draw_h) // 2,
+                       draw_w, draw_h)
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.drawImage(target, self._image)
+        painter.end()
+
+
 class SpriteGeneratorGUI(QMainWindow):
     """Main application window."""
     
@@ -59,6 +110,8 @@ class SpriteGeneratorGUI(QMainWindow):
         self.current_sprite = None
         self.generation_thread = None
         self.pending_update = False
+        self._preview_qimage = None  # Wraps current_sprite's buffer (no copy)
+        self._last_gen_key = None  # Parameters of the last started generation
         
         # Initialize sprite parameters and definitions
         self._init_sprite_data()
@@ -83,9 +136,8 @@ class SpriteGeneratorGUI(QMainWindow):
         self.animation_timer = None
         self.playback_fps = 12
         
-        # Store original pixmaps for re-scaling on resize
-        self.original_preview_pixmap = None
-        self.original_export_pixmap = None
+        # Store original export image for re-scaling on resize
+        self.original_export_image = None
         
         # Resize throttling
         self.resize_timer = QTimer()
@@ -701,7 +753,7 @@ class SpriteGeneratorGUI(QMainWindow):
         self.status_label.setStyleSheet("color: #0a0; font-weight: bold;")
         preview_layout.addWidget(self.status_label, alignment=Qt.AlignCenter)
         
-        self.preview_label = QLabel()
+        self.preview_label = ImagePreviewLabel()
         self.preview_label.setMinimumSize(100, 100)
         self.preview_label.setMaximumSize(16777215, 16777215)  # Qt max size - allow full expansion
         self.preview_label.setStyleSheet("border: 1px solid #ccc; background: #222;")
@@ -1054,6 +1106,7 @@ class SpriteGeneratorGUI(QMainWindow):
     def on_sprite_type_changed(self, sprite_type):
         """Handle sprite type change."""
         self.current_sprite_type = sprite_type
+        self._last_gen_key = None
         self.populate_parameters()
         self.update_color_button()
         self.update_preview()
@@ -1223,8 +1276,7 @@ class SpriteGeneratorGUI(QMainWindow):
                 h, w = sprite.shape[:2]
                 bytes_per_line = w * 4
                 qimage = QImage(sprite.data, w, h, bytes_per_line, QImage.Format_RGBA8888)
-                pixmap = QPixmap.fromImage(qimage)
-                self.set_scaled_pixmap(self.export_preview_label, pixmap)
+                self.set_scaled_image(self.export_preview_label, qimage)
                 
                 # Update info - show actual export size
                 self.export_info_label.setText(
@@ -1266,17 +1318,15 @@ class SpriteGeneratorGUI(QMainWindow):
                     )
                     
                     frame_image = Image.fromarray(sprite, mode='RGBA')
-                    col = frame % cols
-                    row = frame // cols
+                    row, col = divmod(frame, cols)
                     atlas.paste(frame_image, (col * cell_size, row * cell_size))
                 
-                # Convert to QPixmap
+                # Convert to QImage
                 atlas_array = np.array(atlas)
                 h, w = atlas_array.shape[:2]
                 bytes_per_line = w * 4
                 qimage = QImage(atlas_array.data, w, h, bytes_per_line, QImage.Format_RGBA8888)
-                pixmap = QPixmap.fromImage(qimage)
-                self.set_scaled_pixmap(self.export_preview_label, pixmap)
+                self.set_scaled_image(self.export_preview_label, qimage)
                 
                 # Calculate actual export dimensions
                 export_res = int(self.resolution_combo.currentText().split('x')[0])
@@ -1307,12 +1357,11 @@ class SpriteGeneratorGUI(QMainWindow):
                         frame_params
                     )
                     
-                    # Convert to QPixmap
+                    # Wrap as QImage (keeps a reference to the sprite buffer)
                     h, w = sprite.shape[:2]
                     bytes_per_line = w * 4
                     qimage = QImage(sprite.data, w, h, bytes_per_line, QImage.Format_RGBA8888)
-                    pixmap = QPixmap.fromImage(qimage)
-                    self.atlas_frames.append(pixmap)
+                    self.atlas_frames.append(qimage)
                 
                 # Start animation
                 self.current_frame = 0
@@ -1348,7 +1397,7 @@ class SpriteGeneratorGUI(QMainWindow):
         if not self.atlas_frames:
             return
         
-        self.set_scaled_pixmap(self.export_preview_label, self.atlas_frames[self.current_frame])
+        self.set_scaled_image(self.export_preview_label, self.atlas_frames[self.current_frame])
         self.current_frame = (self.current_frame + 1) % len(self.atlas_frames)
     
     def calculate_animated_value(self, key, frame, total_frames):
@@ -1433,6 +1482,13 @@ class SpriteGeneratorGUI(QMainWindow):
     
     def update_preview(self):
         """Update preview with current parameters."""
+        params = self.sprite_params[self.current_sprite_type].copy()
+        
+        # Skip regeneration if nothing visible changed since the last run
+        gen_key = (self.current_sprite_type, tuple(sorted(params.items())))
+        if gen_key == self._last_gen_key:
+            return
+        
         if self.generation_thread and self.generation_thread.isRunning():
             self.pending_update = True
             return
@@ -1440,8 +1496,7 @@ class SpriteGeneratorGUI(QMainWindow):
         self.status_label.setText("Generating...")
         self.status_label.setStyleSheet("color: #fa0; font-weight: bold;")
         
-        params = self.sprite_params[self.current_sprite_type].copy()
-        
+        self._last_gen_key = gen_key
         self.generation_thread = SpriteGeneratorThread(
             self.current_sprite_type,
             self.preview_size,
@@ -1451,36 +1506,32 @@ class SpriteGeneratorGUI(QMainWindow):
         self.generation_thread.finished.connect(self.on_preview_ready)
         self.generation_thread.start()
     
-    def set_scaled_pixmap(self, label, pixmap, store_original=True):
-        """Set a pixmap on a label with proper scaling to fit while maintaining aspect ratio."""
-        if pixmap.isNull():
+    def set_scaled_image(self, label, image, store_original=True):
+        """Set a QImage on a label with proper scaling to fit while maintaining aspect ratio.
+        
+        Scaling happens on the CPU-side QImage; it is converted to a QPixmap once for display.
+        """
+        if image.isNull():
             return
         
         # Clear any text in the label
         label.setText("")
         
-        # Store original pixmap for re-scaling on resize
-        if store_original:
-            if label == self.preview_label:
-                self.original_preview_pixmap = pixmap
-            elif label == self.export_preview_label:
-                self.original_export_pixmap = pixmap
+        # Store original image for re-scaling on resize
+        if store_original and label == self.export_preview_label:
+            self.original_export_image = image
         
         # Get label size
         label_size = label.size()
         
         # Only scale down, never up (max 100%)
-        if pixmap.width() <= label_size.width() and pixmap.height() <= label_size.height():
-            # Pixmap fits, don't scale up
-            label.setPixmap(pixmap)
-        else:
-            # Scale down to fit
-            scaled_pixmap = pixmap.scaled(
+        if image.width() > label_size.width() or image.height() > label_size.height():
+            image = image.scaled(
                 label_size,
                 Qt.KeepAspectRatio,
                 Qt.SmoothTransformation
             )
-            label.setPixmap(scaled_pixmap)
+        label.setPixmap(QPixmap.fromImage(image))
     
     def resizeEvent(self, event):
         """Handle window resize to re-scale preview images."""
@@ -1491,32 +1542,26 @@ class SpriteGeneratorGUI(QMainWindow):
     
     def on_resize_complete(self):
         """Called after resize completes (debounced)."""
-        # Re-scale preview images with stored originals
-        if self.original_preview_pixmap:
-            self.set_scaled_pixmap(
-                self.preview_label, 
-                self.original_preview_pixmap,
-                store_original=False
-            )
-        
-        if self.original_export_pixmap:
-            self.set_scaled_pixmap(
+        # Re-scale export preview with stored original
+        # (the live preview label scales itself at paint time)
+        if self.original_export_image:
+            self.set_scaled_image(
                 self.export_preview_label,
-                self.original_export_pixmap,
+                self.original_export_image,
                 store_original=False
             )
     
     def on_preview_ready(self, sprite):
         """Handle preview generation complete."""
+        # Keep the generated array itself; ascontiguousarray is a no-op for
+        # generator output, and current_sprite keeps the QImage's buffer alive
+        sprite = np.ascontiguousarray(sprite)
         self.current_sprite = sprite
         
-        # Convert to QImage
+        # Wrap the sprite buffer directly; the label paints the QImage as-is
         h, w = sprite.shape[:2]
-        bytes_per_line = w * 4
-        qimage = QImage(sprite.data, w, h, bytes_per_line, QImage.Format_RGBA8888)
-        pixmap = QPixmap.fromImage(qimage)
-        
-        self.set_scaled_pixmap(self.preview_label, pixmap)
+        self._preview_qimage = QImage(sprite.data, w, h, w * 4, QImage.Format_RGBA8888)
+        self.preview_label.set_image(self._preview_qimage)
         self.status_label.setText("Ready")
         self.status_label.setStyleSheet("color: #0a0; font-weight: bold;")
         
@@ -1580,8 +1625,7 @@ class SpriteGeneratorGUI(QMainWindow):
         )
         
         # Save as PNG
-        image = Image.fromarray(sprite, mode='RGBA')
-        image.save(filepath, 'PNG')
+        save_png(sprite, filepath)
     
     def export_animated_atlas(self, filepath, resolution):
         """Export animated sprite atlas."""
@@ -1589,53 +1633,53 @@ class SpriteGeneratorGUI(QMainWindow):
         atlas_width = resolution * self.atlas_cols
         atlas_height = resolution * self.atlas_rows
         
-        # Create atlas image
-        atlas = Image.new('RGBA', (atlas_width, atlas_height), (0, 0, 0, 0))
+        # Create atlas buffer (transparent)
+        atlas = np.zeros((atlas_height, atlas_width, 4), dtype=np.uint8)
         
-        # Generate frames
+        # Precompute each frame's cell slices so the loop only generates and copies
+        R = resolution
         total_frames = min(self.frame_count, self.atlas_rows * self.atlas_cols)
+        cells = [divmod(frame, self.atlas_cols) for frame in range(total_frames)]
+        slices = [(slice(row * R, row * R + R), slice(col * R, col * R + R)) for row, col in cells]
+        
+        # Generate frames
         for frame in range(total_frames):
             # Get animated parameters for this frame
             frame_params = self.get_animated_params(frame, total_frames)
             
-            # Generate frame
-            sprite = SpriteGenerator.generate(
+            sy, sx = slices[frame]
+            atlas[sy, sx] = SpriteGenerator.generate(
                 self.current_sprite_type,
-                resolution,
-                resolution,
+                R,
+                R,
                 frame_params
             )
-            
-            # Convert to PIL Image
-            frame_image = Image.fromarray(sprite, mode='RGBA')
-            
-            # Calculate position in atlas
-            col = frame % self.atlas_cols
-            row = frame // self.atlas_cols
-            x = col * resolution
-            y = row * resolution
-            
-            # Paste into atlas
-            atlas.paste(frame_image, (x, y))
         
         # Save atlas
-        atlas.save(filepath, 'PNG')
+        save_png(atlas, filepath)
     
     def get_versioned_filename(self, filepath):
         """Get versioned filename if file exists."""
         if not os.path.exists(filepath):
             return filepath
         
-        base, ext = os.path.splitext(filepath)
-        version = 0
-        
-        while True:
-            versioned_path = f"{base}_v{version:02d}{ext}"
-            if not os.path.exists(versioned_path):
-                return versioned_path
-            version += 1
-            if version > 99:
-                return filepath
+        dirname, fname = os.path.split(filepath)
+        base, ext = os.path.splitext(fname)
+        
+        # Collect existing version numbers with a single directory scan (case-insensitive,
+        # so Foo_V00.PNG counts as taken on case-insensitive filesystems)
+        pattern = re.compile(re.escape(base) + r'_v(\d+)' + re.escape(ext) + r'$', re.IGNORECASE)
+        used = set()
+        with os.scandir(dirname or '.') as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if match:
+                    used.add(int(match.group(1)))
+        
+        for version in range(100):
+            if version not in used:
+                return os.path.join(dirname, f"{base}_v{version:02d}{ext}")
+        return filepath
 
 
 def main():
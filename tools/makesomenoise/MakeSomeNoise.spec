@@ -19,9 +19,9 @@ a = Analysis(
         'PySide6.QtGui', 
         'PySide6.QtWidgets',
         'numpy',
-        'noise',
         'opensimplex',
-        'perlin_noise',
+        'numba',
+        'pyspng',
         'PIL',
         'PIL._tkinter_finder',
     ],
@@ -9,96 +9,490 @@ from PIL import Image
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QHBoxLayout, QLabel, QSlider, QComboBox, QPushButton,
                                QSpinBox, QGroupBox, QFileDialog, QMessageBox, QLineEdit,
-                               QProgressBar, QGraphicsOpacityEffect)
-from PySide6.QtCore import Qt, QThread, Signal, QTimer, QPropertyAnimation, QPoint, QEasingCurve
-from PySide6.QtGui import QImage, QPixmap, QCursor
-import noise
+                               QProgressBar, QGraphicsOpacityEffect, QCheckBox, QSizePolicy,
+                               QMenu, QDialog, QTabWidget, QTextBrowser, QDialogButtonBox)
+from PySide6.QtCore import (Qt, QObject, QRunnable, QThreadPool, Signal, QTimer, QPropertyAnimation,
+                            QPoint, QEasingCurve, QEvent, QEventLoop, QElapsedTimer)
+from PySide6.QtGui import QImage, QPixmap, QCursor, QGuiApplication, QPainter, QColor
 from opensimplex import OpenSimplex
-from perlin_noise import PerlinNoise
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from functools import lru_cache, partial
+import math
+import multiprocessing
 import os
+import pathlib
 import random
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import traceback
 
+# Optional: Numba JIT for the Perlin kernels (falls back to NumPy when not installed)
+try:
+    from numba import config as numba_config, njit, prange, set_num_threads, threading_layer
+    # Kernels are launched from pool threads; prefer OpenMP, since the TBB layer can hang
+    # interpreter shutdown when first used off the main thread
+    numba_config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+except ImportError:
+    njit = None
+
+# Optional: pyspng for faster PNG encoding on export (falls back to Pillow when not installed)
+try:
+    import pyspng
+except ImportError:
+    pyspng = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _perlin_point(x, y, z, perm, grad, period_x, period_y):
+        """Improved Perlin noise at a single 3D point, optionally periodic in x/y (JIT-compiled)."""
+        x0 = np.floor(x)
+        y0 = np.floor(y)
+        z0 = np.floor(z)
+        ix = int(x0)
+        iy = int(y0)
+        if period_x > 0:
+            X0 = (ix % period_x) & 255
+            X1 = ((ix + 1) % period_x) & 255
+        else:
+            X0 = ix & 255
+            X1 = (ix + 1) & 255
+        if period_y > 0:
+            Y0 = (iy % period_y) & 255
+            Y1 = ((iy + 1) % period_y) & 255
+        else:
+            Y0 = iy & 255
+            Y1 = (iy + 1) & 255
+        Z = int(z0) & 255
+        fx = x - x0
+        fy = y - y0
+        fz = z - z0
+        u = fx * fx * fx * (fx * (fx * 6.0 - 15.0) + 10.0)
+        v = fy * fy * fy * (fy * (fy * 6.0 - 15.0) + 10.0)
+        w = fz * fz * fz * (fz * (fz * 6.0 - 15.0) + 10.0)
+        
+        AA = perm[perm[X0] + Y0] + Z
+        AB = perm[perm[X0] + Y1] + Z
+        BA = perm[perm[X1] + Y0] + Z
+        BB = perm[perm[X1] + Y1] + Z
+        
+        # Gradient dot products at the 8 cube corners
+        g = perm[AA] & 15
+        n000 = grad[g, 0] * fx + grad[g, 1] * fy + grad[g, 2] * fz
+        g = perm[BA] & 15
+        n100 = grad[g, 0] * (fx - 1) + grad[g, 1] * fy + grad[g, 2] * fz
+        g = perm[AB] & 15
+        n010 = grad[g, 0] * fx + grad[g, 1] * (fy - 1) + grad[g, 2] * fz
+        g = perm[BB] & 15
+        n110 = grad[g, 0] * (fx - 1) + grad[g, 1] * (fy - 1) + grad[g, 2] * fz
+        g = perm[AA + 1] & 15
+        n001 = grad[g, 0] * fx + grad[g, 1] * fy + grad[g, 2] * (fz - 1)
+        g = perm[BA + 1] & 15
+        n101 = grad[g, 0] * (fx - 1) + grad[g, 1] * fy + grad[g, 2] * (fz - 1)
+        g = perm[AB + 1] & 15
+        n011 = grad[g, 0] * fx + grad[g, 1] * (fy - 1) + grad[g, 2] * (fz - 1)
+        g = perm[BB + 1] & 15
+        n111 = grad[g, 0] * (fx - 1) + grad[g, 1] * (fy - 1) + grad[g, 2] * (fz - 1)
+        
+        x00 = n000 + u * (n100 - n000)
+        x10 = n010 + u * (n110 - n010)
+        x01 = n001 + u * (n101 - n001)
+        x11 = n011 + u * (n111 - n011)
+        y0_ = x00 + v * (x10 - x00)
+        y1_ = x01 + v * (x11 - x01)
+        return y0_ + w * (y1_ - y0_)
+    
+    @njit(parallel=True, nogil=True, cache=True, fastmath=True)
+    def _perlin_fractal_kernel(xs, ys, z, perm, grad, amps, freqs_x, freqs_y, freqs_z, periods_x, periods_y):
+        """Fractal Perlin sum over the xs x ys grid, parallel over rows (JIT-compiled).
+        
+        Per-octave amplitudes, per-axis frequencies and lattice periods come from
+        NoiseGenerator._perlin_octaves.
+        """
+        h = ys.shape[0]
+        w = xs.shape[0]
+        out = np.empty((h, w), dtype=np.float32)
+        for j in prange(h):
+            for i in range(w):
+                total = 0.0
+                for k in range(amps.shape[0]):
+                    total += amps[k] * _perlin_point(xs[i] * freqs_x[k], ys[j] * freqs_y[k], z * freqs_z[k],
+                                                     perm, grad, periods_x[k], periods_y[k])
+                out[j, i] = total
+        return out
+else:
+    _perlin_fractal_kernel = None
+
+# Blend mode ids for the fused blend kernel
+_BLEND_MODE_IDS = {"Mix": 0, "Add": 1, "Multiply": 2, "Screen": 3, "Overlay": 4, "Min": 5, "Max": 6}
+
+if njit is not None:
+    @njit(parallel=True, nogil=True, cache=True, fastmath=True)
+    def _blend_kernel(a, b, weight, mode_id):
+        """Blend two noise maps in a single pass, matching NoiseWorker.blend_noise (JIT-compiled)."""
+        h, w = a.shape
+        out = np.empty((h, w), dtype=a.dtype)
+        # Mode is dispatched once, outside the pixel loops
+        if mode_id == 0:
+            for j in prange(h):
+                for i in range(w):
+                    out[j, i] = a[j, i] + weight * (b[j, i] - a[j, i])
+        elif mode_id == 1:
+            for j in prange(h):
+                for i in range(w):
+                    out[j, i] = min(max(a[j, i] + b[j, i] * weight, 0.0), 1.0)
+        elif mode_id == 2:
+            for j in prange(h):
+                for i in range(w):
+                    out[j, i] = a[j, i] + weight * (a[j, i] * b[j, i] - a[j, i])
+        elif mode_id == 3:
+            for j in prange(h):
+                for i in range(w):
+                    out[j, i] = a[j, i] + weight * b[j, i] * (1.0 - a[j, i])
+        elif mode_id == 4:
+            for j in prange(h):
+                for i in range(w):
+                    x = a[j, i]
+                    if x < 0.5:
+                        t = 2.0 * x * b[j, i]
+                    else:
+                        t = 1.0 - 2.0 * (1.0 - x) * (1.0 - b[j, i])
+                    out[j, i] = x + weight * (t - x)
+        elif mode_id == 5:
+            for j in prange(h):
+                for i in range(w):
+                    out[j, i] = min(a[j, i], a[j, i] + weight * (b[j, i] - a[j, i]))
+        else:
+            for j in prange(h):
+                for i in range(w):
+                    out[j, i] = max(a[j, i], a[j, i] + weight * (b[j, i] - a[j, i]))
+        return out
+else:
+    _blend_kernel = None
+
+# opensimplex JIT-compiles its scalar kernel when Numba is installed; reuse it for
+# sampling at scattered (warped) positions, which noise3array's grid API can't express.
+# This leans on opensimplex privates (internals._noise3 and each instance's _perm /
+# _perm_grad_index3 tables), so check all of them up front and fall back otherwise
+try:
+    from opensimplex.internals import _noise3 as _opensimplex_noise3
+except ImportError:
+    _opensimplex_noise3 = None
+_probe_simplex = OpenSimplex(seed=0)
+_simplex_internals_ok = (njit is not None and hasattr(_opensimplex_noise3, 'py_func')
+                         and hasattr(_probe_simplex, '_perm')
+                         and hasattr(_probe_simplex, '_perm_grad_index3'))
+del _probe_simplex
+
+if _simplex_internals_ok:
+    @njit(parallel=True, nogil=True, cache=True)
+    def _simplex_scatter_kernel(sample_x, sample_y, z, perm, perm_grad_index3):
+        """OpenSimplex noise at per-pixel (sample_x, sample_y) positions (JIT-compiled)."""
+        h, w = sample_x.shape
+        out = np.empty((h, w), dtype=np.float32)
+        for j in prange(h):
+            for i in range(w):
+                out[j, i] = _opensimplex_noise3(sample_x[j, i], sample_y[j, i], z, perm, perm_grad_index3)
+        return out
+else:
+    _simplex_scatter_kernel = None
 
 class NoiseGenerator:
     """Handles all noise generation algorithms."""
     
+    @staticmethod
+    def to_uint8(noise_map, out=None):
+        """Convert a [0, 1] noise map to an 8-bit grayscale image (into out, if given).
+        
+        Casts as it multiplies, so no full-size float temporary is allocated.
+        """
+        if out is None:
+            out = np.empty(noise_map.shape, dtype=np.uint8)
+        return np.multiply(noise_map, 255, out=out, casting='unsafe')
+    
     @staticmethod
     def make_seamless_blend(noise_map, blend_width=0.1):
         """Apply boundary blending with proper 2D corner handling for seamless tiling."""
         h, w = noise_map.shape
-        result = noise_map.copy()
         
         # Calculate blend zone size
         blend_h = max(2, int(h * blend_width))
         blend_w = max(2, int(w * blend_width))
         
-        # Process each pixel in the blend zones with proper 2D blending
-        for y in range(h):
-            for x in range(w):
-                # Determine if pixel is in blend zone and calculate weights
-                blend_y = 0.0
-                blend_x = 0.0
-                
-                # Vertical blend weight
-                if y < blend_h:
-                    blend_y = 1.0 - (y / float(blend_h))
-                elif y >= h - blend_h:
-                    blend_y = 1.0 - ((h - 1 - y) / float(blend_h))
-                
-                # Horizontal blend weight
-                if x < blend_w:
-                    blend_x = 1.0 - (x / float(blend_w))
-                elif x >= w - blend_w:
-                    blend_x = 1.0 - ((w - 1 - x) / float(blend_w))
-                
-                # Skip if not in any blend zone
-                if blend_y == 0.0 and blend_x == 0.0:
-                    continue
-                
-                # Get the 4 corresponding pixels (current + 3 wraps)
-                p00 = noise_map[y, x]
-                p01 = noise_map[y, (x + w // 2) % w]  # Horizontal wrap
-                p10 = noise_map[(y + h // 2) % h, x]  # Vertical wrap
-                p11 = noise_map[(y + h // 2) % h, (x + w // 2) % w]  # Both wraps
-                
-                # Blend in 2D
-                top_blend = (1 - blend_x) * p00 + blend_x * p01
-                bottom_blend = (1 - blend_x) * p10 + blend_x * p11
-                result[y, x] = (1 - blend_y) * top_blend + blend_y * bottom_blend
+        # Per-row / per-column blend weights (1 at the edge, fading to 0 inside)
+        ys = np.arange(h, dtype=np.float32)
+        xs = np.arange(w, dtype=np.float32)
+        blend_y = np.where(ys < blend_h, 1.0 - ys / blend_h,
+                           np.where(ys >= h - blend_h, 1.0 - (h - 1 - ys) / blend_h, 0.0))[:, None]
+        blend_x = np.where(xs < blend_w, 1.0 - xs / blend_w,
+                           np.where(xs >= w - blend_w, 1.0 - (w - 1 - xs) / blend_w, 0.0))[None, :]
+        
+        # Bands that overlap (tiny images / wide blends): blend the whole map at once
+        if 2 * blend_h >= h or 2 * blend_w >= w:
+            p01 = np.roll(noise_map, -(w // 2), axis=1)
+            p10 = np.roll(noise_map, -(h // 2), axis=0)
+            p11 = np.roll(p01, -(h // 2), axis=0)
+            top_blend = noise_map + blend_x * (p01 - noise_map)
+            bottom_blend = p10 + blend_x * (p11 - p10)
+            return (top_blend + blend_y * (bottom_blend - top_blend)).astype(noise_map.dtype, copy=False)
+        
+        # Otherwise only the border bands change; the interior is copied as is
+        result = noise_map.copy()
+        
+        # Left/right column bands, full height (corners included)
+        for c0, c1 in ((0, blend_w), (w - blend_w, w)):
+            wc0, wc1 = (c0 + w // 2) % w, (c0 + w // 2) % w + (c1 - c0)  # never crosses the edge
+            p00 = noise_map[:, c0:c1]
+            p01 = noise_map[:, wc0:wc1]
+            p10 = np.roll(p00, -(h // 2), axis=0)
+            p11 = np.roll(p01, -(h // 2), axis=0)
+            wx = blend_x[:, c0:c1]
+            top_blend = p00 + wx * (p01 - p00)
+            bottom_blend = p10 + wx * (p11 - p10)
+            result[:, c0:c1] = top_blend + blend_y * (bottom_blend - top_blend)
+        
+        # Top/bottom row bands between the column bands (horizontal weight is 0 there)
+        for r0, r1 in ((0, blend_h), (h - blend_h, h)):
+            wr0, wr1 = (r0 + h // 2) % h, (r0 + h // 2) % h + (r1 - r0)  # never crosses the edge
+            p00 = noise_map[r0:r1, blend_w:w - blend_w]
+            p10 = noise_map[wr0:wr1, blend_w:w - blend_w]
+            result[r0:r1, blend_w:w - blend_w] = p00 + blend_y[r0:r1] * (p10 - p00)
         
         return result
     
     @staticmethod
     def generate(noise_type, width, height, params, seamless=False, blend_width=0.1):
         """Generate noise based on type and parameters."""
-        if noise_type == "Perlin":
-            result = NoiseGenerator._perlin(width, height, params, seamless, blend_width)
-        elif noise_type == "Simplex":
-            result = NoiseGenerator._simplex(width, height, params, seamless, blend_width)
-        elif noise_type == "FBM":
-            result = NoiseGenerator._fbm(width, height, params, seamless, blend_width)
-        elif noise_type == "Turbulence":
-            result = NoiseGenerator._turbulence(width, height, params, seamless, blend_width)
-        elif noise_type == "Ridged":
-            result = NoiseGenerator._ridged(width, height, params, seamless, blend_width)
-        elif noise_type == "Domain Warp":
-            result = NoiseGenerator._domain_warp(width, height, params, seamless, blend_width)
+        generator = NoiseGenerator._DISPATCH.get(noise_type)
+        if generator is None:
+            return np.zeros((height, width), dtype=np.float32)
+        return generator(width, height, params, seamless, blend_width)
+    
+    @staticmethod
+    def warm_up():
+        """Run every generator and the blend kernel once on a tiny grid.
+        
+        Compiling the Numba kernels (or loading them from Numba's cache) takes far
+        longer than a preview; doing it up front keeps the first use of each noise
+        type responsive. Nothing to do without Numba.
+        """
+        if njit is None:
+            return
+        params = {'scale': 4.0, 'octaves': 2, 'persistence': 0.5, 'lacunarity': 2.0, 'seed': 0,
+                  'power': 2.0, 'warp': 1.0, 'x_offset': 0.0, 'y_offset': 0.0, 'z_offset': 0.0,
+                  'sensitivity': 1.0}
+        for noise_type in NoiseGenerator._DISPATCH:
+            for seamless in (False, True):
+                noise_map = NoiseGenerator.generate(noise_type, 8, 8, params, seamless)
+        with NoiseGenerator._kernel_lock:
+            _blend_kernel(noise_map, noise_map, 0.5, 0)
+        
+        # The kernels have now run, so Numba has picked its threading layer. OpenMP
+        # and TBB accept concurrent launches; only the workqueue fallback needs the lock
+        if threading_layer() != "workqueue":
+            NoiseGenerator._kernel_lock = nullcontext()
+    
+    @staticmethod
+    def _normalize_and_invert(noise_map, invert=False, lo=None, hi=None):
+        """Map noise_map from [lo, hi] (default: its own min/max) to 0-1, flipped if invert.
+        
+        Inverting before the seamless blend is equivalent to inverting after it,
+        since the blend is a weighted average.
+        """
+        if lo is None:
+            lo = noise_map.min()
+        if hi is None:
+            hi = noise_map.max()
+        inv = np.float32(1.0 / max(hi - lo, 1e-10))
+        if invert:
+            result = np.float32(hi) - noise_map
         else:
-            result = np.zeros((height, width))
-        
-        # Apply invert if requested
-        if params.get('invert', False):
-            result = 1.0 - result
-        
+            result = noise_map - np.float32(lo)
+        result *= inv
         return result
     
+    # Held around every parallel Numba kernel launch. Preview, frame-stack and warm-up
+    # jobs run on several threads, and Numba's workqueue threading layer (used when
+    # neither OpenMP nor TBB is available) aborts the process on concurrent launches.
+    # warm_up() swaps in a no-op once it knows a thread-safe layer was chosen.
+    _kernel_lock = threading.Lock()
+    
+    # Gradient directions for improved Perlin noise, indexed by (hash & 15)
+    _GRAD3 = np.array([
+        [1, 1, 0], [-1, 1, 0], [1, -1, 0], [-1, -1, 0],
+        [1, 0, 1], [-1, 0, 1], [1, 0, -1], [-1, 0, -1],
+        [0, 1, 1], [0, -1, 1], [0, 1, -1], [0, -1, -1],
+        [1, 1, 0], [0, -1, 1], [-1, 1, 0], [0, -1, -1],
+    ], dtype=np.float32)
+    
+    @staticmethod
+    @lru_cache(maxsize=2)
+    def _coord_grid(w, h, x_off, y_off, scale):
+        """Base lattice coordinates (xs per column, ys per row) for a w x h image.
+        
+        Memoized so layers and slider ticks sharing size/offset/scale reuse the
+        arrays; they are shared, so they are returned read-only.
+        """
+        xs = (np.arange(w, dtype=np.float64) + x_off) / scale
+        ys = (np.arange(h, dtype=np.float64) + y_off) / scale
+        xs.flags.writeable = False
+        ys.flags.writeable = False
+        return xs, ys
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _get_simplex(seed):
+        """Shared OpenSimplex instance for a seed (construction shuffles its tables in Python)."""
+        return OpenSimplex(seed=seed)
+    
+    @staticmethod
+    def _noise3array(simplex, xs, ys, zs):
+        """Batched OpenSimplex noise3array (itself a parallel Numba kernel when Numba is installed)."""
+        with NoiseGenerator._kernel_lock:
+            return simplex.noise3array(xs, ys, zs)
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _perlin_permutation(seed):
+        """Build the doubled 512-entry permutation table for a seed (shared, read-only)."""
+        perm = np.random.default_rng(seed).permutation(256)
+        perm = np.concatenate([perm, perm]).astype(np.intp)
+        perm.flags.writeable = False
+        return perm
+    
+    @staticmethod
+    def _perlin_noise3(xs, ys, z, perm, period_x=0, period_y=0):
+        """Vectorized improved Perlin noise on the grid xs (columns) x ys (rows) at depth z.
+        
+        xs and ys are 1D float64 lattice coordinates; returns a float32 (len(ys), len(xs)) array.
+        A nonzero period wraps the lattice along that axis, making the noise periodic.
+        """
+        # Integer lattice cells and fractional offsets (per axis, cheap 1D work)
+        x0 = np.floor(xs)
+        y0 = np.floor(ys)
+        z0 = np.floor(z)
+        ix = x0.astype(np.intp)
+        iy = y0.astype(np.intp)
+        if period_x:
+            X0, X1 = (ix % period_x) & 255, ((ix + 1) % period_x) & 255
+        else:
+            X0, X1 = ix & 255, (ix + 1) & 255
+        if period_y:
+            Y0, Y1 = (iy % period_y) & 255, ((iy + 1) % period_y) & 255
+        else:
+            Y0, Y1 = iy & 255, (iy + 1) & 255
+        Z = int(z0) & 255
+        fx = (xs - x0).astype(np.float32)[None, :]
+        fy = (ys - y0).astype(np.float32)[:, None]
+        fz = np.float32(z - z0)
+        
+        # Quintic fade curves 6t^5 - 15t^4 + 10t^3
+        u = fx * fx * fx * (fx * (fx * 6 - 15) + 10)
+        v = fy * fy * fy * (fy * (fy * 6 - 15) + 10)
+        w = fz * fz * fz * (fz * (fz * 6 - 15) + 10)
+        
+        # Hash the 8 cube corners
+        hx0 = perm[X0][None, :]
+        hx1 = perm[X1][None, :]
+        AA, AB = perm[hx0 + Y0[:, None]] + Z, perm[hx0 + Y1[:, None]] + Z
+        BA, BB = perm[hx1 + Y0[:, None]] + Z, perm[hx1 + Y1[:, None]] + Z
+        
+        grad = NoiseGenerator._GRAD3
+        
+        def dot(hashed, dx, dy, dz):
+            g = grad[perm[hashed] & 15]
+            return g[..., 0] * dx + g[..., 1] * dy + g[..., 2] * dz
+        
+        fx1, fy1, fz1 = fx - 1, fy - 1, fz - 1
+        x00 = dot(AA, fx, fy, fz) + u * (dot(BA, fx1, fy, fz) - dot(AA, fx, fy, fz))
+        x10 = dot(AB, fx, fy1, fz) + u * (dot(BB, fx1, fy1, fz) - dot(AB, fx, fy1, fz))
+        x01 = dot(AA + 1, fx, fy, fz1) + u * (dot(BA + 1, fx1, fy, fz1) - dot(AA + 1, fx, fy, fz1))
+        x11 = dot(AB + 1, fx, fy1, fz1) + u * (dot(BB + 1, fx1, fy1, fz1) - dot(AB + 1, fx, fy1, fz1))
+        y0_ = x00 + v * (x10 - x00)
+        y1_ = x01 + v * (x11 - x01)
+        return y0_ + w * (y1_ - y0_)
+    
+    @staticmethod
+    def _perlin_octaves(octaves, persistence, lacunarity, tile_x=0.0, tile_y=0.0):
+        """Per-octave amplitudes, per-axis frequencies and lattice periods.
+        
+        tile_x / tile_y give the image size in base lattice units when the noise must tile.
+        Each octave's period is rounded to a whole number of cells and its frequency along
+        that axis nudged to match, so the image edge lands exactly on a lattice wrap.
+        """
+        k = np.arange(octaves)
+        amps = persistence ** k
+        freqs = lacunarity ** k
+        freqs_x, freqs_y = freqs.copy(), freqs.copy()
+        periods_x = np.zeros(octaves, dtype=np.int64)
+        periods_y = np.zeros(octaves, dtype=np.int64)
+        if tile_x > 0:
+            periods_x = np.maximum(1, np.rint(tile_x * freqs)).astype(np.int64)
+            freqs_x = periods_x / tile_x
+        if tile_y > 0:
+            periods_y = np.maximum(1, np.rint(tile_y * freqs)).astype(np.int64)
+            freqs_y = periods_y / tile_y
+        return amps, freqs_x, freqs_y, freqs, periods_x, periods_y
+    
+    @staticmethod
+    def _perlin_fractal(xs, ys, z, perm, octaves, persistence, lacunarity, tile_x=0.0, tile_y=0.0):
+        """Sum octaves of Perlin noise over the xs x ys grid (Numba kernel when available)."""
+        amps, freqs_x, freqs_y, freqs_z, periods_x, periods_y = NoiseGenerator._perlin_octaves(
+            octaves, persistence, lacunarity, tile_x, tile_y)
+        if _perlin_fractal_kernel is not None:
+            with NoiseGenerator._kernel_lock:
+                return _perlin_fractal_kernel(xs, ys, float(z), perm, NoiseGenerator._GRAD3,
+                                              amps, freqs_x, freqs_y, freqs_z, periods_x, periods_y)
+        
+        # NumPy fallback: vectorized per stripe of rows, one pass per octave
+        def stripe(y0, y1):
+            rows = ys[y0:y1]
+            noise_map = np.zeros((len(rows), len(xs)), dtype=np.float32)
+            for k in range(octaves):
+                noise_map += np.float32(amps[k]) * NoiseGenerator._perlin_noise3(
+                    xs * freqs_x[k], rows * freqs_y[k], z * freqs_z[k], perm, periods_x[k], periods_y[k])
+            return noise_map
+        
+        return NoiseGenerator._parallel_rows(stripe, len(ys))
+    
+    # Split row ranges across threads for the NumPy paths (NumPy releases the GIL in its kernels)
+    use_parallel = True
+    _row_pool = None
+    _row_pool_lock = threading.Lock()  # Preview and frame-stack workers may race to create it
+    _MIN_STRIPE_ROWS = 64
+    
+    @staticmethod
+    def _parallel_rows(func, h):
+        """Evaluate func(y0, y1) over row stripes of [0, h) on a shared thread pool and stack them."""
+        n_workers = min(os.cpu_count() or 1, h // NoiseGenerator._MIN_STRIPE_ROWS)
+        if not NoiseGenerator.use_parallel or n_workers < 2:
+            return func(0, h)
+        
+        if NoiseGenerator._row_pool is None:
+            with NoiseGenerator._row_pool_lock:
+                if NoiseGenerator._row_pool is None:
+                    NoiseGenerator._row_pool = ThreadPoolExecutor(max_workers=os.cpu_count(),
+                                                                  thread_name_prefix="noise-rows")
+        bounds = [i * h // n_workers for i in range(n_workers + 1)]
+        futures = [NoiseGenerator._row_pool.submit(func, bounds[i], bounds[i + 1])
+                   for i in range(n_workers)]
+        return np.vstack([f.result() for f in futures])
+    
     @staticmethod
     def _perlin(w, h, p, seamless=False, blend_width=0.1):
-        """Optimized Perlin noise generation with 3D offsets."""
-        noise_map = np.zeros((h, w))
+        """Vectorized fractal Perlin noise generation with 3D offsets."""
         scale = p['scale']
         octaves = int(min(p['octaves'], 10))
-        seed = int(p['seed']) % 256
+        persistence = p['persistence']
+        lacunarity = p['lacunarity']
+        perm = NoiseGenerator._perlin_permutation(int(p['seed']) % 256)
         
         # Apply 3D offsets with sensitivity
         sensitivity = p.get('sensitivity', 1.0)
@@ -106,36 +500,21 @@ class NoiseGenerator:
         y_off = p.get('y_offset', 0.0) * sensitivity
         z_off = p.get('z_offset', 0.0) * sensitivity
         
-        # Generate noise (seamless tiling will be applied via boundary blending)
-        for y in range(h):
-            for x in range(w):
-                nx = (float(x) + x_off) / scale
-                ny = (float(y) + y_off) / scale
-                nz = z_off / scale
-                
-                val = noise.pnoise3(nx, ny, nz, octaves=octaves, 
-                                   persistence=p['persistence'], lacunarity=p['lacunarity'], 
-                                   base=seed)
-                noise_map[y][x] = val
-        
-        # Normalize
-        min_val, max_val = noise_map.min(), noise_map.max()
-        if max_val - min_val > 1e-10:
-            result = (noise_map - min_val) / (max_val - min_val)
-        else:
-            result = noise_map
+        # Base lattice coordinates; seamless tiling wraps the lattice at the image size
+        xs, ys = NoiseGenerator._coord_grid(w, h, x_off, y_off, scale)
+        zs = z_off / scale
+        tile_x, tile_y = (w / scale, h / scale) if seamless else (0.0, 0.0)
         
-        # Apply seamless blending if requested
-        if seamless:
-            result = NoiseGenerator.make_seamless_blend(result, blend_width)
+        noise_map = NoiseGenerator._perlin_fractal(xs, ys, zs, perm, octaves, persistence, lacunarity,
+                                                   tile_x, tile_y)
         
-        return result
+        # Normalize (and invert) in one pass; periodic noise needs no seam blending
+        return NoiseGenerator._normalize_and_invert(noise_map, p.get('invert', False))
     
     @staticmethod
     def _simplex(w, h, p, seamless=False, blend_width=0.1):
         """Optimized Simplex noise generation with 3D offsets."""
-        simplex = OpenSimplex(seed=int(p['seed']) % 256)
-        noise_map = np.zeros((h, w), dtype=np.float32)
+        simplex = NoiseGenerator._get_simplex(int(p['seed']) % 256)
         scale = p['scale']
         
         # Apply 3D offsets with sensitivity
@@ -144,16 +523,13 @@ class NoiseGenerator:
         y_off = p.get('y_offset', 0.0) * sensitivity
         z_off = p.get('z_offset', 0.0) * sensitivity
         
-        # Generate noise
-        for y in range(h):
-            for x in range(w):
-                nx = (x + x_off) / scale
-                ny = (y + y_off) / scale
-                nz = z_off / scale
-                noise_map[y][x] = simplex.noise3(nx, ny, nz)
+        # Generate noise over the whole grid in one batched call
+        xs, ys = NoiseGenerator._coord_grid(w, h, x_off, y_off, scale)
+        zs = np.full(1, z_off / scale)
+        noise_map = NoiseGenerator._noise3array(simplex, xs, ys, zs)[0].astype(np.float32)
         
-        # Normalize to 0-1
-        result = (noise_map + 1.0) * 0.5
+        # Normalize to 0-1 (and invert) in one pass
+        result = NoiseGenerator._normalize_and_invert(noise_map, p.get('invert', False), -1.0, 1.0)
         
         # Apply seamless blending if requested
         if seamless:
@@ -163,40 +539,36 @@ class NoiseGenerator:
     
     @staticmethod
     def _fbm(w, h, p, seamless=False, blend_width=0.1):
-        """Optimized FBM noise generation with 3D offsets."""
+        """FBM noise generation with 3D offsets.
+        
+        Follows perlin_noise.PerlinNoise, which this type was built on: 'octaves'
+        multiplies the lattice frequency of a single gradient-noise layer rather than
+        summing octaves. It uses a separate permutation (seed offset by 256) so it
+        doesn't match Perlin's lattice.
+        """
         octaves = int(min(p['octaves'], 10))
-        perlin = PerlinNoise(octaves=octaves, seed=int(p['seed']) % 256)
-        noise_map = np.zeros((h, w), dtype=np.float32)
-        scale = p['scale']
+        perm = NoiseGenerator._perlin_permutation(256 + int(p['seed']) % 256)
+        scale = p['scale'] / octaves
         
-        # Apply 3D offsets with sensitivity
+        # Apply 3D offsets with sensitivity (in image pixels, so unscaled by octaves)
         sensitivity = p.get('sensitivity', 1.0)
         x_off = p.get('x_offset', 0.0) * sensitivity
         y_off = p.get('y_offset', 0.0) * sensitivity
         z_off = p.get('z_offset', 0.0) * sensitivity
         
-        for y in range(h):
-            for x in range(w):
-                noise_map[y][x] = perlin([(x + x_off)/scale, (y + y_off)/scale, z_off/scale])
-        
-        # Normalize
-        min_val, max_val = noise_map.min(), noise_map.max()
-        if max_val - min_val > 1e-10:
-            result = (noise_map - min_val) / (max_val - min_val)
-        else:
-            result = noise_map
-        
-        # Apply seamless blending if requested
-        if seamless:
-            result = NoiseGenerator.make_seamless_blend(result, blend_width)
+        # Seamless tiling wraps the lattice at the image size
+        xs, ys = NoiseGenerator._coord_grid(w, h, x_off, y_off, scale)
+        tile_x, tile_y = (w / scale, h / scale) if seamless else (0.0, 0.0)
+        noise_map = NoiseGenerator._perlin_fractal(xs, ys, z_off / scale, perm, 1, 0.5, 2.0,
+                                                   tile_x, tile_y)
         
-        return result
+        # Normalize (and invert) in one pass; periodic noise needs no seam blending
+        return NoiseGenerator._normalize_and_invert(noise_map, p.get('invert', False))
     
     @staticmethod
     def _turbulence(w, h, p, seamless=False, blend_width=0.1):
         """Optimized turbulence noise generation with 3D offsets."""
-        simplex = OpenSimplex(seed=int(p['seed']) % 256)
-        noise_map = np.zeros((h, w), dtype=np.float32)
+        simplex = NoiseGenerator._get_simplex(int(p['seed']) % 256)
         scale = p['scale']
         power = p.get('power', 2.0)
         
@@ -206,13 +578,12 @@ class NoiseGenerator:
         y_off = p.get('y_offset', 0.0) * sensitivity
         z_off = p.get('z_offset', 0.0) * sensitivity
         
-        for y in range(h):
-            for x in range(w):
-                val = abs(simplex.noise3((x + x_off)/scale, (y + y_off)/scale, z_off/scale))
-                noise_map[y][x] = val ** power
+        xs, ys = NoiseGenerator._coord_grid(w, h, x_off, y_off, scale)
+        zs = np.full(1, z_off / scale)
+        noise_map = np.abs(NoiseGenerator._noise3array(simplex, xs, ys, zs)[0].astype(np.float32))
+        noise_map **= np.float32(power)
         
-        max_val = noise_map.max()
-        result = noise_map / (max_val + 1e-10) if max_val > 1e-10 else noise_map
+        result = NoiseGenerator._normalize_and_invert(noise_map, p.get('invert', False), 0.0)
         
         # Apply seamless blending if requested
         if seamless:
@@ -223,8 +594,7 @@ class NoiseGenerator:
     @staticmethod
     def _ridged(w, h, p, seamless=False, blend_width=0.1):
         """Optimized ridged multifractal noise generation with 3D offsets."""
-        simplex = OpenSimplex(seed=int(p['seed']) % 256)
-        noise_map = np.zeros((h, w), dtype=np.float32)
+        simplex = NoiseGenerator._get_simplex(int(p['seed']) % 256)
         scale = p['scale']
         octaves = int(min(p['octaves'], 10))
         
@@ -234,20 +604,22 @@ class NoiseGenerator:
         y_off = p.get('y_offset', 0.0) * sensitivity
         z_off = p.get('z_offset', 0.0) * sensitivity
         
-        for y in range(h):
-            for x in range(w):
-                result = 0.0
-                amp, freq = 1.0, 1.0
-                for _ in range(octaves):
-                    signal = 1.0 - abs(simplex.noise3((x + x_off)/scale*freq, (y + y_off)/scale*freq, z_off/scale*freq))
-                    signal *= signal  # Square for sharper ridges
-                    result += signal * amp
-                    amp *= 0.5
-                    freq *= 2.0
-                noise_map[y][x] = result
-        
-        max_val = noise_map.max()
-        result = noise_map / (max_val + 1e-10) if max_val > 1e-10 else noise_map
+        xs, ys = NoiseGenerator._coord_grid(w, h, x_off, y_off, scale)
+        zs = np.full(1, z_off / scale)
+        
+        # One batched call per octave into a layer stack, then a single weighted sum
+        freqs = 2.0 ** np.arange(octaves)
+        amps = (0.5 ** np.arange(octaves)).astype(np.float32)
+        layers = np.empty((octaves, h, w), dtype=np.float32)
+        for k, freq in enumerate(freqs):
+            signal = layers[k]
+            noise = NoiseGenerator._noise3array(simplex, xs * freq, ys * freq, zs * freq)[0]
+            np.abs(noise, out=signal, casting='same_kind')
+            np.subtract(1.0, signal, out=signal)
+            signal *= signal  # Square for sharper ridges
+        noise_map = np.tensordot(amps, layers, axes=1)
+        
+        result = NoiseGenerator._normalize_and_invert(noise_map, p.get('invert', False), 0.0)
         
         # Apply seamless blending if requested
         if seamless:
@@ -259,9 +631,8 @@ class NoiseGenerator:
     def _domain_warp(w, h, p, seamless=False, blend_width=0.1):
         """Optimized domain warp noise generation with 3D offsets."""
         seed = int(p['seed']) % 256
-        simplex = OpenSimplex(seed=seed)
-        simplex_warp = OpenSimplex(seed=seed + 1)
-        noise_map = np.zeros((h, w), dtype=np.float32)
+        simplex = NoiseGenerator._get_simplex(seed)
+        simplex_warp = NoiseGenerator._get_simplex(seed + 1)
         scale = p['scale']
         warp = p.get('warp', 50.0)
         
@@ -271,14 +642,31 @@ class NoiseGenerator:
         y_off = p.get('y_offset', 0.0) * sensitivity
         z_off = p.get('z_offset', 0.0) * sensitivity
         
-        for y in range(h):
-            for x in range(w):
-                wx = simplex_warp.noise3((x + x_off)/scale, (y + y_off)/scale, z_off/scale) * warp
-                wy = simplex_warp.noise3((x + x_off)/scale + 5.2, (y + y_off)/scale + 1.3, z_off/scale) * warp
-                val = simplex.noise3((x+wx)/scale, (y+wy)/scale, z_off/scale)
-                noise_map[y][x] = val
+        # Warp offsets for the whole grid in two batched calls
+        xs, ys = NoiseGenerator._coord_grid(w, h, x_off, y_off, scale)
+        zs = np.full(1, z_off / scale)
+        wx = NoiseGenerator._noise3array(simplex_warp, xs, ys, zs)[0] * warp
+        wy = NoiseGenerator._noise3array(simplex_warp, xs + 5.2, ys + 1.3, zs)[0] * warp
+        
+        # Warped sample positions are scattered: compiled kernel when available, else point by point
+        sample_x = (np.arange(w) + wx) / scale
+        sample_y = (np.arange(h)[:, None] + wy) / scale
+        nz = z_off / scale
+        if _simplex_scatter_kernel is not None:
+            with NoiseGenerator._kernel_lock:
+                noise_map = _simplex_scatter_kernel(sample_x, sample_y, nz,
+                                                    simplex._perm, simplex._perm_grad_index3)
+        else:
+            noise_map = np.empty((h, w), dtype=np.float32)
+            noise3 = simplex.noise3
+            sample_x = sample_x.tolist()
+            sample_y = sample_y.tolist()
+            for y in range(h):
+                row_x = sample_x[y]
+                row_y = sample_y[y]
+                noise_map[y] = [noise3(row_x[x], row_y[x], nz) for x in range(w)]
         
-        result = (noise_map + 1.0) * 0.5
+        result = NoiseGenerator._normalize_and_invert(noise_map, p.get('invert', False), -1.0, 1.0)
         
         # Apply seamless blending if requested
         if seamless:
@@ -287,13 +675,39 @@ class NoiseGenerator:
         return result
 
 
-class NoiseWorker(QThread):
-    """Worker thread for generating composite noise without blocking UI."""
-    finished = Signal(np.ndarray)
+# Noise type name -> generator
+NoiseGenerator._DISPATCH = {
+    "Perlin": NoiseGenerator._perlin,
+    "Simplex": NoiseGenerator._simplex,
+    "FBM": NoiseGenerator._fbm,
+    "Turbulence": NoiseGenerator._turbulence,
+    "Ridged": NoiseGenerator._ridged,
+    "Domain Warp": NoiseGenerator._domain_warp,
+}
+
+
+class NoiseWorkerSignals(QObject):
+    """Signals for NoiseWorker (QRunnable cannot emit signals itself)."""
+    finished = Signal(int, object, object, object)  # job_id, uint8 image, layer A, layer B
+
+
+class NoiseWorker(QRunnable):
+    """Pooled job for generating composite noise without blocking UI.
     
-    def __init__(self, noise_type_a, noise_type_b, width, height, params_a, params_b, 
-                 mix_weight, blend_mode, seamless_tiling=False, blend_width=0.1):
+    Each job carries the job_id it was submitted with; is_current() lets it
+    bail out early once a newer job has superseded it. Layers passed in as
+    cached_a / cached_b are reused instead of regenerated. The emitted image is
+    already uint8 (and half-offset when center_seams is set), so the GUI thread
+    only has to wrap it.
+    """
+    
+    def __init__(self, job_id, is_current, noise_type_a, noise_type_b, width, height, params_a, params_b, 
+                 mix_weight, blend_mode, seamless_tiling=False, blend_width=0.1,
+                 cached_a=None, cached_b=None, center_seams=False):
         super().__init__()
+        self.signals = NoiseWorkerSignals()
+        self.job_id = job_id
+        self.is_current = is_current
         self.noise_type_a = noise_type_a
         self.noise_type_b = noise_type_b
         self.width = width
@@ -304,70 +718,294 @@ class NoiseWorker(QThread):
         self.blend_mode = blend_mode
         self.seamless_tiling = seamless_tiling
         self.blend_width = blend_width
+        self.cached_a = cached_a
+        self.cached_b = cached_b
+        self.center_seams = center_seams
+    
+    def preview_image(self, noise_map):
+        """Convert a noise map to the uint8 image shown in the preview."""
+        img_data = NoiseGenerator.to_uint8(noise_map)
+        return _center_seams(img_data) if self.center_seams else img_data
     
     def run(self):
         try:
-            # Check if interrupted before starting
-            if self.isInterruptionRequested():
+            # Skip if superseded before starting
+            if not self.is_current(self.job_id):
                 return
             
-            # Generate layer A
-            noise_a = NoiseGenerator.generate(self.noise_type_a, self.width, self.height, 
-                                             self.params_a, self.seamless_tiling, self.blend_width)
+            # Full Mix towards B ignores layer A entirely
+            if self.noise_type_b != "None" and self.blend_mode == "Mix" and self.mix_weight == 1.0:
+                noise_b = self.cached_b
+                if noise_b is None:
+                    noise_b = NoiseGenerator.generate(self.noise_type_b, self.width, self.height,
+                                                     self.params_b, self.seamless_tiling, self.blend_width)
+                self.signals.finished.emit(self.job_id, self.preview_image(noise_b), None, noise_b)
+                return
+            
+            # Generate layer A (unless cached)
+            noise_a = self.cached_a
+            if noise_a is None:
+                noise_a = NoiseGenerator.generate(self.noise_type_a, self.width, self.height, 
+                                                 self.params_a, self.seamless_tiling, self.blend_width)
             
-            # Check if interrupted after layer A
-            if self.isInterruptionRequested():
+            # Skip if superseded after layer A
+            if not self.is_current(self.job_id):
                 return
             
-            # If no layer B, return just A
-            if self.noise_type_b == "None":
-                self.finished.emit(noise_a)
+            # If no layer B (or it has zero weight), return just A
+            if self.noise_type_b == "None" or self.mix_weight == 0.0:
+                self.signals.finished.emit(self.job_id, self.preview_image(noise_a), noise_a, None)
                 return
             
-            # Generate layer B
-            noise_b = NoiseGenerator.generate(self.noise_type_b, self.width, self.height, 
-                                             self.params_b, self.seamless_tiling, self.blend_width)
+            # Generate layer B (unless cached)
+            noise_b = self.cached_b
+            if noise_b is None:
+                noise_b = NoiseGenerator.generate(self.noise_type_b, self.width, self.height, 
+                                                 self.params_b, self.seamless_tiling, self.blend_width)
             
-            # Check if interrupted after layer B
-            if self.isInterruptionRequested():
+            # Skip if superseded after layer B
+            if not self.is_current(self.job_id):
                 return
             
             # Blend the layers
             result = self.blend_noise(noise_a, noise_b, self.mix_weight, self.blend_mode)
-            self.finished.emit(result)
+            self.signals.finished.emit(self.job_id, self.preview_image(result), noise_a, noise_b)
         except Exception as e:
             print(f"Error in worker thread: {e}")
-            import traceback
             traceback.print_exc()
             # Emit a black noise map on error to prevent UI freeze
-            fallback = np.zeros((self.height, self.width), dtype=np.float32)
-            self.finished.emit(fallback)
+            fallback = np.zeros((self.height, self.width), dtype=np.uint8)
+            self.signals.finished.emit(self.job_id, fallback, None, None)
     
-    def blend_noise(self, noise_a, noise_b, weight, mode):
+    @staticmethod
+    def blend_noise(noise_a, noise_b, weight, mode):
         """Blend two noise maps using specified mode."""
+        # Every mode reduces to A at zero weight; a full Mix is just B
+        if weight == 0.0:
+            return noise_a
+        if weight == 1.0 and mode == "Mix":
+            return noise_b
+        
+        mode_id = _BLEND_MODE_IDS.get(mode)
+        if _blend_kernel is not None and mode_id is not None and noise_a.dtype == noise_b.dtype:
+            with NoiseGenerator._kernel_lock:
+                return _blend_kernel(noise_a, noise_b, weight, mode_id)
+        
+        # Weighted modes are written as a + w * (target - a)
         if mode == "Mix":
-            return noise_a * (1 - weight) + noise_b * weight
+            return noise_a + weight * (noise_b - noise_a)
         elif mode == "Add":
             result = noise_a + noise_b * weight
-            return np.clip(result, 0, 1)
+            return np.clip(result, 0, 1, out=result)
         elif mode == "Multiply":
-            return noise_a * (noise_b * weight + (1 - weight))
+            return noise_a + weight * (noise_a * noise_b - noise_a)
         elif mode == "Screen":
-            return 1 - (1 - noise_a) * (1 - noise_b * weight)
+            return noise_a + weight * noise_b * (1 - noise_a)
         elif mode == "Overlay":
-            mask = noise_a < 0.5
-            result = np.zeros_like(noise_a)
-            result[mask] = 2 * noise_a[mask] * noise_b[mask]
-            result[~mask] = 1 - 2 * (1 - noise_a[~mask]) * (1 - noise_b[~mask])
-            return noise_a * (1 - weight) + result * weight
+            overlay = np.where(noise_a < 0.5,
+                               2 * noise_a * noise_b,
+                               1 - 2 * (1 - noise_a) * (1 - noise_b))
+            return noise_a + weight * (overlay - noise_a)
         elif mode == "Min":
-            return np.minimum(noise_a, noise_b * weight + noise_a * (1 - weight))
+            return np.minimum(noise_a, noise_a + weight * (noise_b - noise_a))
         elif mode == "Max":
-            return np.maximum(noise_a, noise_b * weight + noise_a * (1 - weight))
+            return np.maximum(noise_a, noise_a + weight * (noise_b - noise_a))
         else:
             return noise_a
 
 
+def _render_frame(noise_type_a, noise_type_b, width, height, params_a, params_b,
+                  mix_weight, blend_mode, seamless_tiling=False, blend_width=0.1):
+    """Generate one composite frame, skipping a layer that the blend weight makes irrelevant.
+    
+    Module-level (and free of GUI state) so export worker processes can run it.
+    """
+    if noise_type_b == "None" or mix_weight == 0.0:
+        return NoiseGenerator.generate(noise_type_a, width, height, params_a, seamless_tiling, blend_width)
+    noise_b = NoiseGenerator.generate(noise_type_b, width, height, params_b, seamless_tiling, blend_width)
+    if blend_mode == "Mix" and mix_weight == 1.0:
+        return noise_b
+    noise_a = NoiseGenerator.generate(noise_type_a, width, height, params_a, seamless_tiling, blend_width)
+    return NoiseWorker.blend_noise(noise_a, noise_b, mix_weight, blend_mode)
+
+
+def _init_export_worker():
+    """Keep each export process's Numba kernels single-threaded; the pool provides the parallelism."""
+    if njit is not None:
+        set_num_threads(1)
+
+
+def _save_gray_png(img_data, path):
+    """Write a uint8 grayscale frame to disk as PNG.
+    
+    Encodes with pyspng when available (it releases the GIL while compressing).
+    Otherwise the PIL image shares the (C-contiguous) array's buffer instead of
+    copying it, so saving a large atlas doesn't hold a second copy in memory.
+    """
+    img_data = np.ascontiguousarray(img_data)
+    if pyspng is not None:
+        with open(path, 'wb') as f:
+            f.write(pyspng.encode(img_data))
+        return
+    height, width = img_data.shape
+    Image.frombuffer('L', (width, height), img_data, 'raw', 'L', 0, 1).save(path)
+
+
+def _center_seams(img_data):
+    """Offset an image by half its size with wrapping, moving the tile seams to the center."""
+    height, width = img_data.shape
+    offset_y = height // 2
+    offset_x = width // 2
+    rest_y = height - offset_y
+    rest_x = width - offset_x
+    
+    # Wrap the image by copying its four quadrants into place (one buffer, one pass)
+    rolled = np.empty_like(img_data)
+    rolled[offset_y:, offset_x:] = img_data[:rest_y, :rest_x]
+    rolled[offset_y:, :offset_x] = img_data[:rest_y, rest_x:]
+    rolled[:offset_y, offset_x:] = img_data[rest_y:, :rest_x]
+    rolled[:offset_y, :offset_x] = img_data[rest_y:, rest_x:]
+    return rolled
+
+
+def _box_downsample(img_data, max_size=256):
+    """Shrink a uint8 image by an integer block mean until it fits in max_size.
+    
+    Edge rows/columns that don't fill a block are dropped. Returns img_data
+    unchanged if it already fits.
+    """
+    height, width = img_data.shape
+    stride = -(-max(height, width) // max_size)
+    if stride <= 1:
+        return img_data
+    blocks = img_data[:height - height % stride, :width - width % stride].reshape(
+        height // stride, stride, width // stride, stride)
+    area = stride * stride
+    return ((blocks.sum(axis=(1, 3), dtype=np.uint32) + area // 2) // area).astype(np.uint8)
+
+
+def _preview_image(img_data):
+    """Scale a uint8 frame to a 256px preview QImage that owns its pixels.
+    
+    Larger frames are box-filtered down in numpy first; Qt only scales up small
+    frames. Uses QImage only (no QPixmap), so frame workers can run it off the
+    GUI thread.
+    """
+    img_data = np.ascontiguousarray(_box_downsample(img_data))
+    height, width = img_data.shape
+    qimg = QImage(img_data.data, width, height, width, QImage.Format_Grayscale8)
+    scaled = qimg.scaled(256, 256, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    # Qt hands back the same (borrowed) image when no scaling is needed; detach it
+    return qimg.copy() if scaled.size() == qimg.size() else scaled
+
+
+class FrameStackWorkerSignals(QObject):
+    """Signals for FrameStackWorker."""
+    progress = Signal(int, int)  # job_id, percent
+    finished = Signal(int, object, object)  # job_id, list of frames, list of uint8 images (or preview QImages)
+
+
+class FrameStackWorker(QRunnable):
+    """Pooled job rendering atlas/animation frames without blocking UI.
+    
+    frame_params holds one (params_a, params_b) pair per frame; frames already
+    available are passed in cached (aligned with frame_params, None where missing).
+    With as_previews, the images come back as scaled preview QImages rather than
+    uint8 arrays. Stops early once is_current() reports the job superseded.
+    """
+    
+    def __init__(self, job_id, is_current, noise_type_a, noise_type_b, size, frame_params,
+                 mix_weight, blend_mode, seamless_tiling=False, blend_width=0.1, cached=None,
+                 as_previews=False):
+        super().__init__()
+        self.signals = FrameStackWorkerSignals()
+        self.job_id = job_id
+        self.is_current = is_current
+        self.noise_type_a = noise_type_a
+        self.noise_type_b = noise_type_b
+        self.size = size
+        self.frame_params = frame_params
+        self.mix_weight = mix_weight
+        self.blend_mode = blend_mode
+        self.seamless_tiling = seamless_tiling
+        self.blend_width = blend_width
+        self.cached = cached or [None] * len(frame_params)
+        self.as_previews = as_previews
+    
+    def run(self):
+        try:
+            frames = []
+            num_frames = len(self.frame_params)
+            for i, (params_a, params_b) in enumerate(self.frame_params):
+                if not self.is_current(self.job_id):
+                    return
+                
+                frame = self.cached[i]
+                if frame is None:
+                    frame = _render_frame(self.noise_type_a, self.noise_type_b, self.size, self.size,
+                                          params_a, params_b, self.mix_weight, self.blend_mode, self.seamless_tiling, self.blend_width)
+                frames.append(frame)
+                self.signals.progress.emit(self.job_id, int(((i + 1) / num_frames) * 100))
+            
+            images = [NoiseGenerator.to_uint8(frame) for frame in frames]
+            if self.as_previews:
+                images = [_preview_image(img_data) for img_data in images]
+            self.signals.finished.emit(self.job_id, frames, images)
+        except Exception as e:
+            print(f"Error in frame worker thread: {e}")
+            traceback.print_exc()
+            # Emit an empty stack so the UI leaves its busy state
+            self.signals.finished.emit(self.job_id, [], [])
+
+
+class SparkleOverlay(QWidget):
+    """Click-through overlay that paints the easter-egg sparkle dots itself.
+    
+    One widget and one 30 ms timer for every dot, instead of a QLabel per dot.
+    """
+    
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._sparkles = []  # (x, y, appear_ms, vanish_ms)
+        self._shown = 0
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._tick = QTimer(self)
+        self._tick.setInterval(30)
+        self._tick.timeout.connect(self.advance)
+    
+    def add_burst(self, sparkles):
+        """Schedule (x, y, appear_delay_ms, vanish_delay_ms) dots, positioned in parent coordinates."""
+        now = self._clock.elapsed()
+        self._sparkles.extend((x, y, now + appear, now + vanish) for x, y, appear, vanish in sparkles)
+        self.setGeometry(self.parentWidget().rect())
+        self.show()
+        self.raise_()
+        self._tick.start()
+    
+    def advance(self):
+        """Drop finished dots and repaint only when the set of visible dots changes."""
+        now = self._clock.elapsed()
+        count = len(self._sparkles)
+        self._sparkles = [s for s in self._sparkles if s[3] > now]
+        shown = sum(1 for s in self._sparkles if s[2] <= now)
+        if shown != self._shown or len(self._sparkles) != count:
+            self._shown = shown
+            self.update()
+        if not self._sparkles:
+            self._tick.stop()
+            self.hide()
+    
+    def paintEvent(self, event):
+        now = self._clock.elapsed()
+        painter = QPainter(self)
+        color = QColor("#aaa")
+        for x, y, appear, vanish in self._sparkles:
+            if appear <= now < vanish:
+                painter.fillRect(x, y, 2, 2, color)
+
+
 class NoiseGeneratorGUI(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -429,35 +1067,116 @@ class NoiseGeneratorGUI(QMainWindow):
         self.seamless_tiling = True  # Seamless tiling option (default enabled)
         self.seamless_blend_width = 0.1  # Blend width for seamless tiling (10%)
         self.center_seams = False  # Center seams visualization (default disabled)
+        self.atlas_size = 256  # Export frame size, kept in sync with atlas_size_combo
         
         self.preview_size = 256
+        
+        # While a slider is held, preview at a lower resolution and upscale for display
+        self.drag_preview_size = 64
+        self._dragging = False
+        
+        # Preview jobs run on the shared thread pool; only the latest job_id is displayed
+        self.pool = QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(os.cpu_count() or 1)
+        self.job_id = 0
+        self._preview_busy = False
+        # What the preview shows / the in-flight job will show, to skip redundant jobs
+        self._shown_preview_key = None
+        self._pending_preview_key = None
+        
+        # Coalesce bursts of parameter changes into at most one preview job per frame (~60 Hz)
+        self._refresh_timer = QTimer()
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(16)
+        self._refresh_timer.timeout.connect(self.update_preview)
+        # Parameters whose full-resolution render is costly wait a little longer for
+        # keyboard/wheel steps to settle; drags always use the low-res frame interval
+        self.preview_delays = {'octaves': 150, 'warp': 60}
+        
+        # Recent layer results keyed by everything that affects them, so changing one
+        # layer (or only the blend) doesn't regenerate the other
+        self.layer_cache = OrderedDict()
+        self.layer_cache_size = 4
+        self._job_layer_keys = (None, None)
+        
+        # Composite frames for atlas/animation previews and exports
+        self._frame_cache = OrderedDict()
+        self._frame_cache_size = 64
+        
+        # Atlas/animation previews render on their own single-thread pool, so
+        # clearing the preview queue never drops them
+        self.stack_pool = QThreadPool(self)
+        self.stack_pool.setMaxThreadCount(1)
+        self.stack_job_id = 0
+        self._stack_mode = None
+        
+        # Worker processes for atlas/sequence exports, started on first export
+        self._export_pool = None
+        # uint8 buffers reused by repeat exports at the same layout, keyed by shape
+        self._export_buffers = {}
+        self._last_progress_update = 0.0
+        self._help_dialog = None
         self.noise_type_a = "Perlin"
         self.noise_type_b = "None"
-        self.worker = None
         self.manual_filename = False  # Track if user manually edited filename
         
         # Set default save directory to Pictures folder
-        import pathlib
         self.default_save_dir = str(pathlib.Path.home() / "Pictures" / "NoiseExports")
         os.makedirs(self.default_save_dir, exist_ok=True)
         
         # Animation state
-        self.atlas_frames = []  # Store individual frames for animation
+        self.atlas_frames = []  # Preview-sized pixmaps for animation playback
         self.current_frame = 0
-        self.animation_timer = None
+        self.animation_timer = QTimer(self)
+        self.animation_timer.timeout.connect(self.update_animation_frame)
+        self._playback_requested = False  # Playback wanted; paused while the window is hidden
         
         self.init_ui()
         self.update_preview()
+        # Compile the remaining noise kernels in the background (on the stack pool, which
+        # update_preview never clears, so the warm-up isn't dropped by early previews)
+        self.stack_pool.start(NoiseGenerator.warm_up)
         
         # Sparkle animation for easter egg hint
         self.sparkle_timer = QTimer()
         self.sparkle_timer.timeout.connect(self.trigger_sparkle)
         self.sparkle_timer.start(random.randint(5000, 15000))  # First sparkle in 5-15 seconds
+        # Click-through layer that paints the sparkle dots
+        self.sparkle_overlay = SparkleOverlay(self)
+        self.sparkle_overlay.hide()
+    
+    def closeEvent(self, event):
+        """Shut down the export worker processes along with the window."""
+        if self._export_pool is not None:
+            self._export_pool.shutdown(cancel_futures=True)
+            self._export_pool = None
+        super().closeEvent(event)
+    
+    def hideEvent(self, event):
+        """Pause preview playback and sparkles while the window is hidden."""
+        self.animation_timer.stop()
+        self.sparkle_timer.stop()
+        super().hideEvent(event)
+    
+    def showEvent(self, event):
+        """Resume preview playback and sparkles when the window is shown again."""
+        super().showEvent(event)
+        self.resume_animation()
+        self.resume_sparkles()
+    
+    def changeEvent(self, event):
+        """Pause preview playback and sparkles while minimized."""
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.animation_timer.stop()
+                self.sparkle_timer.stop()
+            else:
+                self.resume_animation()
+                self.resume_sparkles()
+        super().changeEvent(event)
     
     def contextMenuEvent(self, event):
         """Handle right-click context menu anywhere in the application."""
-        from PySide6.QtWidgets import QMenu
-        
         menu = QMenu()
         
         # Export options
@@ -470,6 +1189,9 @@ class NoiseGeneratorGUI(QMainWindow):
         export_sequence_action = menu.addAction("🎞️ Export File Sequence")
         export_sequence_action.triggered.connect(self.export_sequence)
         
+        export_video_action = menu.addAction("🎬 Export MP4 Video")
+        export_video_action.triggered.connect(self.export_video)
+        
         menu.addSeparator()
         
         # Clipboard option
@@ -543,7 +1265,6 @@ class NoiseGeneratorGUI(QMainWindow):
         self.add_slider(self.params_a_layout, "Sensitivity", 'sensitivity', 1, 300, 10, scale=0.01, layer='A')
         
         # Add invert checkbox
-        from PySide6.QtWidgets import QCheckBox
         self.invert_checkbox_a = QCheckBox("Invert Output")
         self.invert_checkbox_a.setChecked(False)
         self.invert_checkbox_a.setToolTip("Invert the noise values (black ↔ white)")
@@ -573,23 +1294,10 @@ class NoiseGeneratorGUI(QMainWindow):
         mix_layout.addLayout(blend_row)
         
         # Weight slider
-        weight_container = QWidget()
-        weight_layout = QHBoxLayout(weight_container)
-        weight_layout.setContentsMargins(0, 0, 0, 0)
-        weight_label = QLabel("A ← Weight → B:")
-        weight_label.setToolTip("Balance between layer A (left) and layer B (right)")
-        weight_layout.addWidget(weight_label)
-        self.weight_slider = QSlider(Qt.Horizontal)
-        self.weight_slider.setMinimum(0)
-        self.weight_slider.setMaximum(100)
-        self.weight_slider.setValue(50)
-        self.weight_slider.setToolTip("")  # Prevent parent tooltip inheritance
-        self.weight_slider.valueChanged.connect(self.on_weight_changed)
-        weight_layout.addWidget(self.weight_slider, 2)
-        self.weight_label = QLabel("0.50")
+        weight_container, _, self.weight_slider, self.weight_label = self.make_slider_row(
+            "A ← Weight → B:", 0, 100, 50, "0.50",
+            "Balance between layer A (left) and layer B (right)", self.on_weight_changed)
         self.weight_label.setMinimumWidth(40)
-        self.weight_label.setToolTip("")  # Prevent parent tooltip inheritance
-        weight_layout.addWidget(self.weight_label)
         mix_layout.addWidget(weight_container)
         
         mix_group.setLayout(mix_layout)
@@ -646,6 +1354,7 @@ class NoiseGeneratorGUI(QMainWindow):
         # Copyright and version info at bottom left (clickable easter egg)
         copyright_container = QWidget()
         copyright_container.setObjectName("copyright_container")
+        self.copyright_container = copyright_container  # Sparkle anchor
         copyright_layout = QVBoxLayout(copyright_container)
         copyright_layout.setContentsMargins(0, 0, 0, 0)
         copyright_layout.setSpacing(2)  # Minimal space between lines
@@ -686,41 +1395,55 @@ class NoiseGeneratorGUI(QMainWindow):
             'sensitivity': 'Multiplier for X/Y/Z offset effects\nHigher = offsets have stronger effect'
         }
         
+        container, lbl, slider, value_label = self.make_slider_row(
+            f"{label}:", min_val, max_val, int(default),
+            f"{default * scale:.2f}" if scale != 1.0 else str(default),
+            tooltips.get(key), partial(self.on_slider_value_changed, layer, key, scale))
+        lbl.setMinimumWidth(100)
+        
+        value_label.setFixedWidth(50)
+        value_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        value_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
+        container.layout().setAlignment(value_label, Qt.AlignRight)
+        
+        sliders_dict = self.sliders_a if layer == 'A' else self.sliders_b
+        sliders_dict[key] = (container, slider, value_label, scale)
+        layout.addWidget(container)
+    
+    def make_slider_row(self, label_text, min_val, max_val, default, value_text, tooltip, on_change):
+        """Build a label / slider / value row wired to the drag-preview handlers.
+        
+        Returns (container, label, slider, value_label). Only the label carries a
+        tooltip; the slider and value label clear theirs so they don't inherit the
+        parent's.
+        """
         container = QWidget()
-        h_layout = QHBoxLayout(container)
-        h_layout.setContentsMargins(0, 0, 0, 0)
+        row = QHBoxLayout(container)
+        row.setContentsMargins(0, 0, 0, 0)
         
-        lbl = QLabel(f"{label}:")
-        lbl.setMinimumWidth(100)
-        # Apply tooltip to label if available
-        if key in tooltips:
-            lbl.setToolTip(tooltips[key])
-        h_layout.addWidget(lbl)
+        label = QLabel(label_text)
+        if tooltip:
+            label.setToolTip(tooltip)
+        row.addWidget(label)
         
         slider = QSlider(Qt.Horizontal)
         slider.setMinimum(min_val)
         slider.setMaximum(max_val)
-        slider.setValue(int(default))
+        slider.setValue(default)
         slider.setToolTip("")  # Prevent parent tooltip inheritance
-        slider.valueChanged.connect(lambda v: self.on_param_changed(layer, key, v * scale))
-        h_layout.addWidget(slider)
+        slider.valueChanged.connect(on_change)
+        slider.sliderPressed.connect(self.on_slider_pressed)
+        slider.sliderReleased.connect(self.on_slider_released)
+        row.addWidget(slider, 1)
         
-        value_label = QLabel(f"{default * scale:.2f}" if scale != 1.0 else str(default))
-        value_label.setFixedWidth(50)
-        value_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        value_label = QLabel(value_text)
         value_label.setToolTip("")  # Prevent parent tooltip inheritance
-        from PySide6.QtWidgets import QSizePolicy
-        value_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
-        h_layout.addWidget(value_label, 0, Qt.AlignRight)
+        row.addWidget(value_label)
         
-        sliders_dict = self.sliders_a if layer == 'A' else self.sliders_b
-        sliders_dict[key] = (container, slider, value_label, scale)
-        layout.addWidget(container)
+        return container, label, slider, value_label
     
     def create_preview_panel(self):
         """Create preview and export panel."""
-        from PySide6.QtWidgets import QSizePolicy
-        
         panel = QWidget()
         layout = QVBoxLayout(panel)
         layout.setSpacing(10)  # Consistent spacing between groups
@@ -742,10 +1465,11 @@ class NoiseGeneratorGUI(QMainWindow):
         self.preview_label.setFixedSize(self.preview_size, self.preview_size)
         self.preview_label.setStyleSheet("border: 1px solid #ccc; background: #000;")
         self.preview_label.setToolTip("")  # No tooltip on preview
+        # The stylesheet paints the full background, so Qt needn't erase it first
+        self.preview_label.setAttribute(Qt.WA_OpaquePaintEvent)
         preview_layout.addWidget(self.preview_label, alignment=Qt.AlignCenter)
         
         # Preview controls at bottom left
-        from PySide6.QtWidgets import QCheckBox
         preview_controls = QWidget()
         preview_controls_layout = QVBoxLayout(preview_controls)
         preview_controls_layout.setContentsMargins(0, 0, 0, 0)
@@ -757,24 +1481,12 @@ class NoiseGeneratorGUI(QMainWindow):
         self.tiling_checkbox.stateChanged.connect(self.on_tiling_changed)
         preview_controls_layout.addWidget(self.tiling_checkbox)
         
-        # Blend width slider
-        blend_width_container = QWidget()
-        blend_width_layout = QHBoxLayout(blend_width_container)
-        blend_width_layout.setContentsMargins(0, 0, 0, 0)
-        blend_width_label = QLabel("Blend Width:")
-        blend_width_label.setToolTip("Width of edge blending for seamless tiling\nHigher values = smoother but more visible blend")
-        blend_width_layout.addWidget(blend_width_label)
-        self.blend_width_slider = QSlider(Qt.Horizontal)
-        self.blend_width_slider.setMinimum(5)
-        self.blend_width_slider.setMaximum(40)
-        self.blend_width_slider.setValue(10)  # 10%
-        self.blend_width_slider.setToolTip("")  # Prevent parent tooltip inheritance
-        self.blend_width_slider.valueChanged.connect(self.on_blend_width_changed)
-        blend_width_layout.addWidget(self.blend_width_slider)
-        self.blend_width_label = QLabel("10%")
+        # Blend width slider (10% default)
+        blend_width_container, _, self.blend_width_slider, self.blend_width_label = self.make_slider_row(
+            "Blend Width:", 5, 40, 10, "10%",
+            "Width of edge blending for seamless tiling\nHigher values = smoother but more visible blend\n(Perlin and FBM tile exactly and ignore this)",
+            self.on_blend_width_changed)
         self.blend_width_label.setMinimumWidth(40)
-        self.blend_width_label.setToolTip("")  # Prevent parent tooltip inheritance
-        blend_width_layout.addWidget(self.blend_width_label)
         preview_controls_layout.addWidget(blend_width_container)
         
         self.center_seams_checkbox = QCheckBox("Center Seams")
@@ -814,6 +1526,7 @@ class NoiseGeneratorGUI(QMainWindow):
         self.export_preview_label.setStyleSheet("border: 1px solid #ccc; background: #222; color: #888;")
         self.export_preview_label.setAlignment(Qt.AlignCenter)
         self.export_preview_label.setToolTip("")  # Prevent parent tooltip inheritance
+        self._export_preview_styled = False  # Placeholder style until the first image
         export_preview_layout.addWidget(self.export_preview_label, alignment=Qt.AlignCenter)
         
         self.export_info_label = QLabel("")
@@ -837,6 +1550,7 @@ class NoiseGeneratorGUI(QMainWindow):
         self.playback_fps_spin.setMaximum(60)
         self.playback_fps_spin.setValue(12)
         self.playback_fps_spin.setToolTip("")  # Prevent parent tooltip inheritance
+        self.playback_fps_spin.valueChanged.connect(self.on_playback_fps_changed)
         fps_row.addWidget(self.playback_fps_spin)
         export_preview_layout.addLayout(fps_row)
         
@@ -905,7 +1619,7 @@ class NoiseGeneratorGUI(QMainWindow):
         export_layout.addLayout(atlas_row)
         
         # Connect for filename updates
-        self.atlas_size_combo.currentTextChanged.connect(self.update_suggested_filename)
+        self.atlas_size_combo.currentTextChanged.connect(self.on_atlas_size_changed)
         self.frame_spin.valueChanged.connect(self.update_suggested_filename)
         
         # Progress bar
@@ -959,7 +1673,7 @@ class NoiseGeneratorGUI(QMainWindow):
             self.noise_type_b = text
         self.update_param_visibility()
         self.update_suggested_filename()
-        self.update_preview()
+        self.schedule_preview()
     
     def on_manual_filename_change(self):
         """Track if user manually edited filename."""
@@ -977,16 +1691,14 @@ class NoiseGeneratorGUI(QMainWindow):
             name_parts.append(self.noise_type_b.replace(' ', ''))
         
         # Add size
-        size = self.atlas_size_combo.currentText().split('x')[0] if hasattr(self, 'atlas_size_combo') else "256"
-        name_parts.append(size)
+        name_parts.append(str(self.atlas_size))
         
         # Check if atlas export (more than 1 frame)
         if hasattr(self, 'frame_spin'):
             num_frames = self.frame_spin.value()
             if num_frames > 1:
                 # Calculate grid
-                cols = int(np.ceil(np.sqrt(num_frames)))
-                rows = int(np.ceil(num_frames / cols))
+                cols, rows = self.atlas_grid(num_frames)
                 name_parts.append(f"{cols}x{rows}")
         
         filename = "_".join(name_parts) + ".png"
@@ -994,58 +1706,65 @@ class NoiseGeneratorGUI(QMainWindow):
         # Create full path with default directory
         full_path = os.path.join(self.default_save_dir, filename)
         
+        if self.output_path.text() == full_path:
+            return  # Nothing changed; skip the textChanged round trip
+        
         # Temporarily disable manual tracking
         old_manual = self.manual_filename
         self.output_path.setText(full_path)
         self.manual_filename = old_manual
     
+    @staticmethod
+    def tile_atlas(stack, cols, rows):
+        """Lay out a (cols * rows, h, w) frame stack as a row-major atlas image."""
+        _, height, width = stack.shape
+        return stack.reshape(rows, cols, height, width).swapaxes(1, 2).reshape(rows * height, cols * width)
+    
+    def export_buffer(self, name, shape):
+        """Return a reusable uint8 buffer for export, reallocated only when its shape changes."""
+        buffer = self._export_buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = self._export_buffers[name] = np.empty(shape, dtype=np.uint8)
+        return buffer
+    
+    @staticmethod
+    def atlas_grid(num_frames):
+        """Return (cols, rows) for a near-square atlas holding num_frames."""
+        cols = math.isqrt(num_frames - 1) + 1 if num_frames > 0 else 0
+        rows = -(-num_frames // cols) if cols else 0
+        return cols, rows
+    
+    def on_atlas_size_changed(self, text):
+        """Track the selected export frame size."""
+        self.atlas_size = int(text.split('x')[0])
+        self.update_suggested_filename()
+    
     def on_blend_changed(self, text):
         """Handle blend mode change."""
         self.blend_mode = text
-        # Debounce updates
-        if not hasattr(self, 'update_timer'):
-            self.update_timer = QTimer()
-            self.update_timer.setSingleShot(True)
-            self.update_timer.timeout.connect(self.update_preview)
-        self.update_timer.start(300)
+        self.schedule_preview()
     
     def on_weight_changed(self, value):
         """Handle weight slider change."""
         self.mix_weight = value / 100.0
         self.weight_label.setText(f"{self.mix_weight:.2f}")
-        if not hasattr(self, 'update_timer'):
-            self.update_timer = QTimer()
-            self.update_timer.setSingleShot(True)
-            self.update_timer.timeout.connect(self.update_preview)
-        self.update_timer.start(300)
+        self.schedule_preview()
     
     def on_tiling_changed(self, state):
         """Handle tiling checkbox change."""
         self.seamless_tiling = (state == 2)  # Qt.Checked = 2
-        if not hasattr(self, 'update_timer'):
-            self.update_timer = QTimer()
-            self.update_timer.setSingleShot(True)
-            self.update_timer.timeout.connect(self.update_preview)
-        self.update_timer.start(300)
+        self.schedule_preview()
     
     def on_center_seams_changed(self, state):
         """Handle center seams checkbox change."""
         self.center_seams = (state == 2)  # Qt.Checked = 2
-        if not hasattr(self, 'update_timer'):
-            self.update_timer = QTimer()
-            self.update_timer.setSingleShot(True)
-            self.update_timer.timeout.connect(self.update_preview)
-        self.update_timer.start(300)
+        self.schedule_preview()
     
     def on_blend_width_changed(self, value):
         """Handle blend width slider change."""
         self.seamless_blend_width = value / 100.0  # Convert to 0.05-0.40 range
         self.blend_width_label.setText(f"{value}%")
-        if not hasattr(self, 'update_timer'):
-            self.update_timer = QTimer()
-            self.update_timer.setSingleShot(True)
-            self.update_timer.timeout.connect(self.update_preview)
-        self.update_timer.start(300)
+        self.schedule_preview()
     
     def on_invert_changed(self, layer, state):
         """Handle invert checkbox change."""
@@ -1055,12 +1774,7 @@ class NoiseGeneratorGUI(QMainWindow):
         else:
             self.params_b['invert'] = invert_value
         
-        # Debounce updates
-        if not hasattr(self, 'update_timer'):
-            self.update_timer = QTimer()
-            self.update_timer.setSingleShot(True)
-            self.update_timer.timeout.connect(self.update_preview)
-        self.update_timer.start(300)
+        self.schedule_preview()
     
     def update_param_visibility(self):
         """Update parameter visibility based on selected noise types."""
@@ -1076,6 +1790,10 @@ class NoiseGeneratorGUI(QMainWindow):
             container = widgets[0]
             container.setVisible(key in visible_params_b)
     
+    def on_slider_value_changed(self, layer, key, scale, value):
+        """Map a parameter slider's integer position to its parameter value."""
+        self.on_param_changed(layer, key, value * scale)
+    
     def on_param_changed(self, layer, key, value):
         """Handle parameter change."""
         params = self.params_a if layer == 'A' else self.params_b
@@ -1089,111 +1807,186 @@ class NoiseGeneratorGUI(QMainWindow):
         else:
             label.setText(str(int(value)))
         
-        # Debounce updates
-        if not hasattr(self, 'update_timer'):
-            self.update_timer = QTimer()
-            self.update_timer.setSingleShot(True)
-            self.update_timer.timeout.connect(self.update_preview)
-        self.update_timer.start(300)
+        delay = 16 if self._dragging else self.preview_delays.get(key, 16)
+        self.schedule_preview(delay)
+    
+    def schedule_preview(self, delay_ms=16):
+        """Request a preview refresh; changes arriving before it fires share the same job."""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start(delay_ms)
+    
+    def on_slider_pressed(self):
+        """Switch to low-resolution previews while a slider is dragged."""
+        self._dragging = True
+    
+    def on_slider_released(self):
+        """Render the full-resolution preview once the slider is released."""
+        self._dragging = False
+        self._refresh_timer.stop()
+        self.update_preview()
+    
+    def scaled_preview_params(self, params, factor):
+        """Copy params so noise rendered at 1/factor resolution matches the full-size preview."""
+        params = params.copy()
+        for key in ('scale', 'warp', 'x_offset', 'y_offset', 'z_offset'):
+            params[key] = params[key] / factor
+        return params
+    
+    def layer_cache_key(self, noise_type, params, size):
+        """Key identifying a generated layer."""
+        return (noise_type, tuple(sorted(params.items())), self.seamless_tiling,
+                self.seamless_blend_width, size)
+    
+    def get_cached_layer(self, key):
+        """Return a cached layer (marking it most recently used), or None."""
+        noise = self.layer_cache.get(key)
+        if noise is not None:
+            self.layer_cache.move_to_end(key)
+        return noise
+    
+    def cache_layer(self, key, noise):
+        """Store a generated layer, evicting the least recently used."""
+        if key is None or noise is None:
+            return
+        self.layer_cache[key] = noise
+        self.layer_cache.move_to_end(key)
+        while len(self.layer_cache) > self.layer_cache_size:
+            self.layer_cache.popitem(last=False)
     
     def update_preview(self):
-        """Update noise preview using worker thread."""
-        # If worker is currently running, stop it first
-        if self.worker is not None and self.worker.isRunning():
-            try:
-                # Disconnect signals so old worker doesn't update UI
-                self.worker.finished.disconnect()
-                # Request interruption
-                self.worker.requestInterruption()
-                # Don't wait for it to finish, just disconnect
-            except (RuntimeError, TypeError):
-                pass  # Worker already deleted or signals already disconnected
+        """Update noise preview on the shared thread pool."""
+        # Render at reduced resolution while dragging (features scaled to match)
+        size = self.drag_preview_size if self._dragging else self.preview_size
+        factor = self.preview_size / size
+        
+        params_a = self.scaled_preview_params(self.params_a, factor)
+        params_b = self.scaled_preview_params(self.params_b, factor)
+        
+        # Nothing to do if this exact preview is already shown (or on its way)
+        preview_key = (self.frame_cache_key(params_a, params_b, size, size), self.center_seams)
+        target_key = self._pending_preview_key if self._pending_preview_key is not None else self._shown_preview_key
+        if preview_key == target_key:
+            return
+        self._pending_preview_key = preview_key
+        
+        # Supersede any in-flight job and drop queued ones that haven't started
+        self.job_id += 1
+        self.pool.clear()
         
         # Update UI status
         self.status_label.setText("Rendering...")
         self.status_label.setStyleSheet("color: #fa0; font-weight: bold;")
-        QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
+        if not self._preview_busy:
+            QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
+            self._preview_busy = True
+        
+        key_a = self.layer_cache_key(self.noise_type_a, params_a, size)
+        key_b = self.layer_cache_key(self.noise_type_b, params_b, size) if self.noise_type_b != "None" else None
+        self._job_layer_keys = (key_a, key_b)
         
-        # Create new worker thread for composite noise
-        self.worker = NoiseWorker(
+        # Submit a job for composite noise
+        worker = NoiseWorker(
+            self.job_id, self.is_current_job,
             self.noise_type_a, self.noise_type_b,
-            self.preview_size, self.preview_size,
-            self.params_a.copy(), self.params_b.copy(),
-            self.mix_weight, self.blend_mode, self.seamless_tiling, self.seamless_blend_width
+            size, size, params_a, params_b,
+            self.mix_weight, self.blend_mode, self.seamless_tiling, self.seamless_blend_width,
+            self.get_cached_layer(key_a), self.get_cached_layer(key_b) if key_b is not None else None,
+            center_seams=self.center_seams
         )
-        self.worker.finished.connect(self.on_preview_finished)
-        self.worker.start()
+        worker.signals.finished.connect(self.on_preview_finished)
+        self.pool.start(worker)
     
-    def generate_composite_noise(self, width, height):
-        """Generate composite noise from layers A and B."""
-        # Generate layer A
-        noise_a = NoiseGenerator.generate(self.noise_type_a, width, height, self.params_a, self.seamless_tiling, self.seamless_blend_width)
-        
-        # If no layer B, return just A
+    def is_current_job(self, job_id):
+        """Return True if job_id is the most recently submitted preview job."""
+        return job_id == self.job_id
+    
+    @staticmethod
+    def _params_key(params):
+        """Hashable snapshot of a parameter dict."""
+        return tuple(sorted(params.items()))
+    
+    def frame_cache_key(self, params_a, params_b, width, height):
+        """Key identifying a composite frame."""
+        if self.noise_type_b == "None" or self.mix_weight == 0.0:
+            # Layer A alone: B's params, weight and blend mode don't affect the frame
+            return (self.noise_type_a, width, height, self._params_key(params_a),
+                    self.seamless_tiling, self.seamless_blend_width)
+        return (self.noise_type_a, self.noise_type_b, width, height,
+                self._params_key(params_a), self._params_key(params_b),
+                self.mix_weight, self.blend_mode, self.seamless_tiling, self.seamless_blend_width)
+    
+    def cache_frame(self, key, frame):
+        """Store a composite frame, evicting the least recently used."""
+        self._frame_cache[key] = frame
+        self._frame_cache.move_to_end(key)
+        while len(self._frame_cache) > self._frame_cache_size:
+            self._frame_cache.popitem(last=False)
+    
+    def get_cached_frame(self, key):
+        """Return a cached composite frame (marking it most recently used), or None."""
+        frame = self._frame_cache.get(key)
+        if frame is not None:
+            self._frame_cache.move_to_end(key)
+        return frame
+    
+    def animated_params(self, frame, anim_rate):
+        """Layer params for an animation frame, advancing z_offset by anim_rate per frame."""
+        params_a = {**self.params_a, 'z_offset': self.params_a.get('z_offset', 0.0) + frame * anim_rate}
         if self.noise_type_b == "None":
-            return noise_a
-        
-        # Generate layer B
-        noise_b = NoiseGenerator.generate(self.noise_type_b, width, height, self.params_b, self.seamless_tiling, self.seamless_blend_width)
-        
-        # Blend the layers
-        return self.blend_noise(noise_a, noise_b, self.mix_weight, self.blend_mode)
+            return params_a, self.params_b
+        params_b = {**self.params_b, 'z_offset': self.params_b.get('z_offset', 0.0) + frame * anim_rate}
+        return params_a, params_b
     
-    def blend_noise(self, noise_a, noise_b, weight, mode):
-        """Blend two noise maps using specified mode."""
-        if mode == "Mix":
-            return noise_a * (1 - weight) + noise_b * weight
-        elif mode == "Add":
-            result = noise_a + noise_b * weight
-            return np.clip(result, 0, 1)
-        elif mode == "Multiply":
-            return noise_a * (noise_b * weight + (1 - weight))
-        elif mode == "Screen":
-            return 1 - (1 - noise_a) * (1 - noise_b * weight)
-        elif mode == "Overlay":
-            mask = noise_a < 0.5
-            result = np.zeros_like(noise_a)
-            result[mask] = 2 * noise_a[mask] * noise_b[mask]
-            result[~mask] = 1 - 2 * (1 - noise_a[~mask]) * (1 - noise_b[~mask])
-            return noise_a * (1 - weight) + result * weight
-        elif mode == "Min":
-            return np.minimum(noise_a, noise_b * weight + noise_a * (1 - weight))
-        elif mode == "Max":
-            return np.maximum(noise_a, noise_b * weight + noise_a * (1 - weight))
-        else:
-            return noise_a
+    def generate_composite_noise(self, width, height, params_a=None, params_b=None):
+        """Generate composite noise from layers A and B (defaulting to the current params)."""
+        if params_a is None:
+            params_a = self.params_a
+        if params_b is None:
+            params_b = self.params_b
+        key = self.frame_cache_key(params_a, params_b, width, height)
+        cached = self.get_cached_frame(key)
+        if cached is not None:
+            return cached.copy()
+        
+        result = _render_frame(self.noise_type_a, self.noise_type_b, width, height, params_a, params_b,
+                               self.mix_weight, self.blend_mode, self.seamless_tiling, self.seamless_blend_width)
+        self.cache_frame(key, result.copy())
+        return result
     
-    def on_preview_finished(self, noise_map):
+    def on_preview_finished(self, job_id, img_data, noise_a, noise_b):
         """Handle preview generation completion."""
+        # Ignore results from superseded jobs
+        if job_id != self.job_id:
+            return
+        shown_key, self._pending_preview_key = self._pending_preview_key, None
+        key_a, key_b = self._job_layer_keys
+        self.cache_layer(key_a, noise_a)
+        self.cache_layer(key_b, noise_b)
         try:
-            img_data = (noise_map * 255).astype(np.uint8)
-            
-            # Apply 50% offset with wrapping if center seams is enabled
-            if self.center_seams:
-                height, width = img_data.shape
-                offset_y = height // 2
-                offset_x = width // 2
-                
-                # Create wrapped/rolled image
-                img_data = np.roll(img_data, offset_y, axis=0)
-                img_data = np.roll(img_data, offset_x, axis=1)
-            
-            height, width = img_data.shape
-            qimg = QImage(img_data.data, width, height, width, QImage.Format_Grayscale8)
+            # The worker already converted to uint8 and applied the center-seams offset
+            qimg = self.gray_qimage(img_data)
+            if img_data.shape[1] != self.preview_size:
+                # Low-resolution drag preview: cheap nearest-neighbour upscale while the
+                # slider is held; release renders full resolution, which needs no scaling
+                transform = Qt.FastTransformation if self._dragging else Qt.SmoothTransformation
+                qimg = qimg.scaled(self.preview_size, self.preview_size,
+                                   Qt.IgnoreAspectRatio, transform)
             pixmap = QPixmap.fromImage(qimg)
             self.preview_label.setPixmap(pixmap)
+            if noise_a is not None or noise_b is not None:  # Not the error fallback
+                self._shown_preview_key = shown_key
             
             self.status_label.setText("Ready")
             self.status_label.setStyleSheet("color: #0a0; font-weight: bold;")
         except Exception as e:
             print(f"Error displaying preview: {e}")
-            import traceback
             traceback.print_exc()
             self.status_label.setText("Error")
             self.status_label.setStyleSheet("color: #f00; font-weight: bold;")
         finally:
             # Always restore cursor, even on error
             QApplication.restoreOverrideCursor()
+            self._preview_busy = False
     
     def generate_preview(self):
         """Generate preview based on selected mode without saving."""
@@ -1206,10 +1999,10 @@ class NoiseGeneratorGUI(QMainWindow):
         try:
             if mode == "Single Frame":
                 self.preview_single_frame()
-            elif mode == "Atlas":
-                self.preview_atlas()
-            elif mode == "Anim Preview":
-                self.preview_animation()
+            elif mode in ("Atlas", "Anim Preview"):
+                # Rendered in the background; on_frame_stack_finished resets the status
+                self.start_frame_stack(mode)
+                return
             
             self.status_label.setText("Ready")
             self.status_label.setStyleSheet("color: #0a0; font-weight: bold;")
@@ -1220,141 +2013,144 @@ class NoiseGeneratorGUI(QMainWindow):
     
     def preview_single_frame(self):
         """Preview single frame at export resolution."""
-        res_text = self.atlas_size_combo.currentText()
-        size = int(res_text.split('x')[0])
+        self.cancel_frame_stack()
+        size = self.atlas_size
         
         # Generate noise at export resolution
         noise_map = self.generate_composite_noise(size, size)
-        img_data = (noise_map * 255).astype(np.uint8)
+        img_data = NoiseGenerator.to_uint8(noise_map)
         
         # Display in preview
-        height, width = img_data.shape
-        qimg = QImage(img_data.data, width, height, width, QImage.Format_Grayscale8)
+        qimg = self.gray_qimage(img_data)
         pixmap = QPixmap.fromImage(qimg)
         scaled_pixmap = pixmap.scaled(256, 256, Qt.KeepAspectRatio, Qt.SmoothTransformation)
         
-        self.export_preview_label.setPixmap(scaled_pixmap)
-        self.export_preview_label.setStyleSheet("border: 1px solid #ccc; background: #000;")
+        self.show_export_pixmap(scaled_pixmap)
         
         info = f"Single Frame Preview\nResolution: {size}x{size}\n\nNot saved - click 'Export Single Frame' to save"
         self.export_info_label.setText(info)
         
         # Stop any running animation
-        if self.animation_timer is not None:
-            self.animation_timer.stop()
+        self.stop_animation()
     
-    def preview_atlas(self):
-        """Preview complete atlas layout."""
+    def start_frame_stack(self, mode):
+        """Render the atlas/animation frames for the preview on the frame-stack pool."""
         num_frames = self.frame_spin.value()
-        frame_size = int(self.atlas_size_combo.currentText().split('x')[0])
+        frame_size = self.atlas_size
         anim_rate = self.anim_rate_spin.value()
         
+        # Supersede any stack still rendering
+        self.stack_job_id += 1
+        self._stack_mode = (mode, num_frames, frame_size, anim_rate)
+        
+        # Animate using z_offset
+        frame_params = [self.animated_params(i, anim_rate) for i in range(num_frames)]
+        
+        # Playback only ever shows preview-sized frames, so render them at that size
+        # (features scaled to match) rather than at export resolution
+        render_size = frame_size
+        if mode == "Anim Preview" and frame_size > self.preview_size:
+            render_size = self.preview_size
+            factor = frame_size / render_size
+            frame_params = [(self.scaled_preview_params(pa, factor), self.scaled_preview_params(pb, factor))
+                            for pa, pb in frame_params]
+        
+        keys = [self.frame_cache_key(pa, pb, render_size, render_size) for pa, pb in frame_params]
+        self._stack_keys = keys
+        
+        worker = FrameStackWorker(
+            self.stack_job_id, self.is_current_stack,
+            self.noise_type_a, self.noise_type_b, render_size, frame_params,
+            self.mix_weight, self.blend_mode, self.seamless_tiling, self.seamless_blend_width,
+            [self.get_cached_frame(key) for key in keys],
+            as_previews=(mode != "Atlas")
+        )
+        worker.signals.progress.connect(self.on_frame_stack_progress)
+        worker.signals.finished.connect(self.on_frame_stack_finished)
+        self.stack_pool.start(worker)
+    
+    def is_current_stack(self, job_id):
+        """Return True if job_id is the most recently submitted frame-stack job."""
+        return job_id == self.stack_job_id
+    
+    def cancel_frame_stack(self):
+        """Discard any atlas/animation preview still rendering."""
+        self.stack_job_id += 1
+    
+    def on_frame_stack_progress(self, job_id, progress):
+        """Report frame-stack progress in the status label."""
+        if job_id != self.stack_job_id:
+            return
+        mode = self._stack_mode[0]
+        label = "Generating Animation" if mode == "Anim Preview" else "Generating Preview"
+        self.status_label.setText(f"{label}... {progress}%")
+    
+    def on_frame_stack_finished(self, job_id, frames, images):
+        """Show a finished atlas/animation preview."""
+        if job_id != self.stack_job_id:
+            return
+        mode, num_frames, frame_size, anim_rate = self._stack_mode
+        try:
+            if len(frames) != num_frames:
+                raise RuntimeError("frame generation failed")
+            for key, frame in zip(self._stack_keys, frames):
+                self.cache_frame(key, frame)
+            
+            if mode == "Atlas":
+                self.preview_atlas(images, frame_size, anim_rate)
+            else:
+                self.preview_animation(images, frame_size, anim_rate)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Preview failed: {str(e)}")
+        finally:
+            self.status_label.setText("Ready")
+            self.status_label.setStyleSheet("color: #0a0; font-weight: bold;")
+    
+    def preview_atlas(self, frames, frame_size, anim_rate):
+        """Preview complete atlas layout from rendered uint8 frames."""
+        num_frames = len(frames)
+        
         # Calculate grid layout
-        cols = int(np.ceil(np.sqrt(num_frames)))
-        rows = int(np.ceil(num_frames / cols))
+        cols, rows = self.atlas_grid(num_frames)
         atlas_width = cols * frame_size
         atlas_height = rows * frame_size
         
-        atlas = np.zeros((atlas_height, atlas_width), dtype=np.uint8)
-        
-        # Generate frames
-        for i in range(num_frames):
-            progress = int((i / num_frames) * 100)
-            self.status_label.setText(f"Generating Preview... {progress}%")
-            QApplication.processEvents()
-            
-            # Animate using z_offset
-            params_a_copy = self.params_a.copy()
-            params_b_copy = self.params_b.copy()
-            
-            params_a_copy['z_offset'] = self.params_a.get('z_offset', 0.0) + (i * anim_rate)
-            if self.noise_type_b != "None":
-                params_b_copy['z_offset'] = self.params_b.get('z_offset', 0.0) + (i * anim_rate)
-            
-            # Temporarily set params
-            old_params_a = self.params_a
-            old_params_b = self.params_b
-            self.params_a = params_a_copy
-            self.params_b = params_b_copy
-            
-            noise_map = self.generate_composite_noise(frame_size, frame_size)
-            
-            # Restore params
-            self.params_a = old_params_a
-            self.params_b = old_params_b
-            
-            img_data = (noise_map * 255).astype(np.uint8)
-            
-            row = i // cols
-            col = i % cols
-            y = row * frame_size
-            x = col * frame_size
-            atlas[y:y+frame_size, x:x+frame_size] = img_data
+        # Unused grid cells stay black
+        stack = np.zeros((cols * rows, frame_size, frame_size), dtype=np.uint8)
+        np.stack(frames, out=stack[:num_frames])
+        atlas = self.tile_atlas(stack, cols, rows)
         
         # Display atlas preview
-        height, width = atlas.shape
-        qimg = QImage(atlas.data, width, height, width, QImage.Format_Grayscale8)
+        qimg = self.gray_qimage(atlas)
         pixmap = QPixmap.fromImage(qimg)
         scaled_pixmap = pixmap.scaled(256, 256, Qt.KeepAspectRatio, Qt.SmoothTransformation)
         
-        self.export_preview_label.setPixmap(scaled_pixmap)
-        self.export_preview_label.setStyleSheet("border: 1px solid #ccc; background: #000;")
+        self.show_export_pixmap(scaled_pixmap)
         
         info = f"Atlas Preview\n{num_frames} frames in {cols}x{rows} grid\nFrame: {frame_size}x{frame_size}\nTotal: {atlas_width}x{atlas_height}\nAnimation Rate: {anim_rate}\n\nNot saved - click 'Export Animation Atlas' to save"
         self.export_info_label.setText(info)
         
         # Stop any running animation
-        if self.animation_timer is not None:
-            self.animation_timer.stop()
+        self.stop_animation()
     
-    def preview_animation(self):
-        """Preview animation sequence."""
-        num_frames = self.frame_spin.value()
-        frame_size = int(self.atlas_size_combo.currentText().split('x')[0])
-        anim_rate = self.anim_rate_spin.value()
-        
-        # Clear and generate frames
-        self.atlas_frames = []
-        
-        for i in range(num_frames):
-            progress = int((i / num_frames) * 100)
-            self.status_label.setText(f"Generating Animation... {progress}%")
-            QApplication.processEvents()
-            
-            # Animate using z_offset
-            params_a_copy = self.params_a.copy()
-            params_b_copy = self.params_b.copy()
-            
-            params_a_copy['z_offset'] = self.params_a.get('z_offset', 0.0) + (i * anim_rate)
-            if self.noise_type_b != "None":
-                params_b_copy['z_offset'] = self.params_b.get('z_offset', 0.0) + (i * anim_rate)
-            
-            # Temporarily set params
-            old_params_a = self.params_a
-            old_params_b = self.params_b
-            self.params_a = params_a_copy
-            self.params_b = params_b_copy
-            
-            noise_map = self.generate_composite_noise(frame_size, frame_size)
-            
-            # Restore params
-            self.params_a = old_params_a
-            self.params_b = old_params_b
-            
-            img_data = (noise_map * 255).astype(np.uint8)
-            self.atlas_frames.append(img_data.copy())
+    def preview_animation(self, frames, frame_size, anim_rate):
+        """Preview animation sequence from preview QImages scaled by the frame worker."""
+        num_frames = len(frames)
+        self.atlas_frames = [QPixmap.fromImage(qimg) for qimg in frames]
         
         # Start animation
         self.current_frame = 0
         fps = self.playback_fps_spin.value()
-        info = f"Animation Preview\n{num_frames} frames at {fps} FPS\nFrame: {frame_size}x{frame_size}\nAnimation Rate: {anim_rate}\n\nLooping...\n\nNot saved - click 'Export Animation Atlas' to save"
+        frame_info = f"Frame: {frame_size}x{frame_size}"
+        if frame_size > self.preview_size:
+            # start_frame_stack rendered these at preview size; fine octaves can differ
+            frame_info += f"\n(approximate: rendered at {self.preview_size}x{self.preview_size})"
+        info = f"Animation Preview\n{num_frames} frames at {fps} FPS\n{frame_info}\nAnimation Rate: {anim_rate}\n\nLooping...\n\nNot saved - click 'Export Animation Atlas' to save"
         self.export_info_label.setText(info)
         self.start_animation()
     
     def show_export_context_menu(self, position):
         """Show context menu for export buttons."""
-        from PySide6.QtWidgets import QMenu
-        
         menu = QMenu()
         
         # Export options
@@ -1367,6 +2163,9 @@ class NoiseGeneratorGUI(QMainWindow):
         export_sequence_action = menu.addAction("Export File Sequence")
         export_sequence_action.triggered.connect(self.export_sequence)
         
+        export_video_action = menu.addAction("Export MP4 Video")
+        export_video_action.triggered.connect(self.export_video)
+        
         menu.addSeparator()
         
         # Open save location
@@ -1379,8 +2178,6 @@ class NoiseGeneratorGUI(QMainWindow):
     
     def copy_preview_to_clipboard(self):
         """Copy the current preview image to clipboard."""
-        from PySide6.QtGui import QGuiApplication
-        
         # Get the current preview pixmap
         pixmap = self.preview_label.pixmap()
         if pixmap and not pixmap.isNull():
@@ -1393,8 +2190,13 @@ class NoiseGeneratorGUI(QMainWindow):
     
     def show_help_dialog(self):
         """Show comprehensive help dialog with noise type information."""
-        from PySide6.QtWidgets import QDialog, QTabWidget, QTextBrowser, QVBoxLayout, QDialogButtonBox
-        
+        # Built on first use and kept, so reopening doesn't re-parse all the HTML
+        if self._help_dialog is None:
+            self._help_dialog = self.build_help_dialog()
+        self._help_dialog.exec()
+    
+    def build_help_dialog(self):
+        """Create the help dialog: a usage guide tab plus one tab per noise type."""
         dialog = QDialog(self)
         dialog.setWindowTitle("A Guide To Noise")
         dialog.resize(750, 650)
@@ -1548,7 +2350,7 @@ class NoiseGeneratorGUI(QMainWindow):
         layout.addWidget(button_box)
         
         dialog.setLayout(layout)
-        dialog.exec()
+        return dialog
     
     def show_about_dialog(self):
         """Show About dialog with application information."""
@@ -1588,9 +2390,7 @@ Right-click anywhere for quick access to export options and tools.
         QMessageBox.about(self, "About MakeSomeNoise", about_text)
     
     def open_save_location(self):
-        """Open the save directory in Windows Explorer."""
-        import subprocess
-        
+        """Open the save directory in Explorer (or the platform's file browser)."""
         # Get the directory from current output path or use default
         output_path = self.output_path.text()
         if output_path:
@@ -1608,9 +2408,12 @@ Right-click anywhere for quick access to export options and tools.
         # Ensure directory exists
         os.makedirs(directory, exist_ok=True)
         
-        # Open in Explorer
+        # Open in Explorer via the shell directly (no command line to quote)
         try:
-            subprocess.Popen(f'explorer "{directory}"')
+            if sys.platform == 'win32':
+                os.startfile(directory)
+            else:
+                subprocess.Popen(["open" if sys.platform == 'darwin' else "xdg-open", directory])
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not open Explorer: {str(e)}")
     
@@ -1631,27 +2434,28 @@ Right-click anywhere for quick access to export options and tools.
         base = base_path[:-4]
         ext = '.png'
         
-        # Check if file exists
-        version = 0
-        versioned_path = f"{base}_v{version:02d}{ext}"
-        
-        while os.path.exists(versioned_path):
-            version += 1
-            versioned_path = f"{base}_v{version:02d}{ext}"
-        
-        return versioned_path
+        version = self.next_version(base, ext)
+        return f"{base}_v{version:02d}{ext}"
     
     def get_versioned_folder_name(self, base_folder):
         """Get folder name with version number, incrementing if folder exists."""
-        # Check if folder exists
-        version = 0
-        versioned_folder = f"{base_folder}_v{version:02d}"
-        
-        while os.path.exists(versioned_folder):
-            version += 1
-            versioned_folder = f"{base_folder}_v{version:02d}"
-        
-        return versioned_folder
+        version = self.next_version(base_folder)
+        return f"{base_folder}_v{version:02d}"
+    
+    @staticmethod
+    def next_version(base, ext=''):
+        """Return one past the highest existing f"{base}_vNN{ext}" version (0 if none).
+        
+        Reads the directory once instead of stat-ing v00, v01, ... in turn.
+        """
+        directory = os.path.dirname(base) or '.'
+        pattern = re.compile(re.escape(os.path.basename(base)) + r'_v(\d+)' + re.escape(ext) + '$',
+                             re.IGNORECASE)
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return 0
+        return max((int(m.group(1)) for m in map(pattern.match, names) if m), default=-1) + 1
     
     def export_single(self):
         """Export single frame of noise."""
@@ -1667,17 +2471,15 @@ Right-click anywhere for quick access to export options and tools.
         QApplication.processEvents()
         
         # Get selected resolution
-        res_text = self.atlas_size_combo.currentText()
-        size = int(res_text.split('x')[0])
+        size = self.atlas_size
         
         # Generate noise at export resolution
         noise_map = self.generate_composite_noise(size, size)
-        img_data = (noise_map * 255).astype(np.uint8)
-        img = Image.fromarray(img_data, mode='L')
-        img.save(output_path)
+        img_data = NoiseGenerator.to_uint8(noise_map)
+        _save_gray_png(img_data, output_path)
         
         # Show preview
-        self.show_export_preview(img, f"Single Frame: {size}x{size}\n{os.path.basename(output_path)}")
+        self.show_export_preview(img_data, f"Single Frame: {size}x{size}\n{os.path.basename(output_path)}")
         
         # Update output path to show versioned filename
         old_manual = self.manual_filename
@@ -1690,6 +2492,7 @@ Right-click anywhere for quick access to export options and tools.
     
     def export_atlas(self):
         """Export animation atlas."""
+        self.cancel_frame_stack()
         filename = self.output_path.text()
         if not filename:
             QMessageBox.warning(self, "Error", "Please specify output filename")
@@ -1712,60 +2515,33 @@ Right-click anywhere for quick access to export options and tools.
         
         try:
             num_frames = self.frame_spin.value()
-            frame_size = int(self.atlas_size_combo.currentText().split('x')[0])
+            frame_size = self.atlas_size
             
             # Calculate grid layout
-            cols = int(np.ceil(np.sqrt(num_frames)))
-            rows = int(np.ceil(num_frames / cols))
+            cols, rows = self.atlas_grid(num_frames)
             atlas_width = cols * frame_size
             atlas_height = rows * frame_size
             
-            atlas = np.zeros((atlas_height, atlas_width), dtype=np.uint8)
+            # Frames are converted straight into their atlas cells (no separate
+            # frame stack); unused cells stay black
+            atlas = self.export_buffer('atlas', (atlas_height, atlas_width))
+            cells = atlas.reshape(rows, frame_size, cols, frame_size).swapaxes(1, 2)
+            for i in range(num_frames, cols * rows):
+                cells[divmod(i, cols)] = 0
             
             # Clear previous frames and prepare for new animation
             self.atlas_frames = []
             anim_rate = self.anim_rate_spin.value()
             
             # Generate frames
-            for i in range(num_frames):
-                # Update progress
-                progress = int((i / num_frames) * 100)
-                self.progress_bar.setValue(progress)
-                QApplication.processEvents()
-                
-                # Animate using z_offset with animation rate
-                params_a_copy = self.params_a.copy()
-                params_b_copy = self.params_b.copy()
-                
-                # Use z_offset for animation (works for all noise types now)
-                params_a_copy['z_offset'] = self.params_a.get('z_offset', 0.0) + (i * anim_rate)
-                if self.noise_type_b != "None":
-                    params_b_copy['z_offset'] = self.params_b.get('z_offset', 0.0) + (i * anim_rate)
-                
-                # Temporarily set animated params
-                old_params_a = self.params_a
-                old_params_b = self.params_b
-                self.params_a = params_a_copy
-                self.params_b = params_b_copy
-                
-                noise_map = self.generate_composite_noise(frame_size, frame_size)
-                
-                # Restore params
-                self.params_a = old_params_a
-                self.params_b = old_params_b
-                img_data = (noise_map * 255).astype(np.uint8)
+            for i, noise_map in enumerate(self.render_export_frames(num_frames, frame_size, anim_rate)):
+                self.report_export_progress(i, num_frames)
+                img_data = NoiseGenerator.to_uint8(noise_map, out=cells[divmod(i, cols)])
                 
                 # Store frame for animation
-                self.atlas_frames.append(img_data.copy())
-                
-                row = i // cols
-                col = i % cols
-                y = row * frame_size
-                x = col * frame_size
-                atlas[y:y+frame_size, x:x+frame_size] = img_data
+                self.atlas_frames.append(self.animation_frame_pixmap(img_data))
             
-            img = Image.fromarray(atlas, mode='L')
-            img.save(filename)
+            _save_gray_png(atlas, filename)
             
             # Start animated preview
             self.current_frame = 0
@@ -1788,9 +2564,10 @@ Right-click anywhere for quick access to export options and tools.
     
     def export_sequence(self):
         """Export animation as individual frames in a folder."""
+        self.cancel_frame_stack()
         # Build descriptive folder name
         num_frames = self.frame_spin.value()
-        frame_size = int(self.atlas_size_combo.currentText().split('x')[0])
+        frame_size = self.atlas_size
         
         # Get base name from user input or generate one
         user_name = self.output_path.text()
@@ -1834,45 +2611,27 @@ Right-click anywhere for quick access to export options and tools.
             frame_prefix = "_".join(noise_prefix_parts) + f"_{version_suffix}"
             
             # Generate and save frames
-            for i in range(num_frames):
-                # Update progress
-                progress = int((i / num_frames) * 100)
-                self.progress_bar.setValue(progress)
-                self.status_label.setText(f"Exporting frame {i+1}/{num_frames}...")
-                self.status_label.setStyleSheet("color: #fa0; font-weight: bold;")
-                QApplication.processEvents()
-                
-                # Animate using z_offset with animation rate
-                params_a_copy = self.params_a.copy()
-                params_b_copy = self.params_b.copy()
-                
-                params_a_copy['z_offset'] = self.params_a.get('z_offset', 0.0) + (i * anim_rate)
-                if self.noise_type_b != "None":
-                    params_b_copy['z_offset'] = self.params_b.get('z_offset', 0.0) + (i * anim_rate)
-                
-                # Temporarily set animated params
-                old_params_a = self.params_a
-                old_params_b = self.params_b
-                self.params_a = params_a_copy
-                self.params_b = params_b_copy
-                
-                noise_map = self.generate_composite_noise(frame_size, frame_size)
-                
-                # Restore params
-                self.params_a = old_params_a
-                self.params_b = old_params_b
-                
-                img_data = (noise_map * 255).astype(np.uint8)
-                
-                # Store frame for animation preview
-                self.atlas_frames.append(img_data.copy())
-                
-                # Save individual frame with noise type and version prefix
-                frame_filename = f"{frame_prefix}_frame_{i:0{padding_width}d}.png"
-                frame_path = os.path.join(folder_path, frame_filename)
-                
-                img = Image.fromarray(img_data, mode='L')
-                img.save(frame_path)
+            self.status_label.setStyleSheet("color: #fa0; font-weight: bold;")
+            # PNG encoding runs on writer threads (zlib releases the GIL) while the
+            # next frame renders; each frame gets its own array since it's handed off
+            with ThreadPoolExecutor(max_workers=4) as writer:
+                pending = deque()
+                for i, noise_map in enumerate(self.render_export_frames(num_frames, frame_size, anim_rate)):
+                    self.report_export_progress(i, num_frames, f"Exporting frame {i+1}/{num_frames}...")
+                    img_data = NoiseGenerator.to_uint8(noise_map)
+                    
+                    # Store frame for animation preview
+                    self.atlas_frames.append(self.animation_frame_pixmap(img_data))
+                    
+                    # Save individual frame with noise type and version prefix
+                    frame_filename = f"{frame_prefix}_frame_{i:0{padding_width}d}.png"
+                    frame_path = os.path.join(folder_path, frame_filename)
+                    
+                    if len(pending) >= 8:
+                        pending.popleft().result()
+                    pending.append(writer.submit(_save_gray_png, img_data, frame_path))
+                while pending:
+                    pending.popleft().result()
             
             # Start animated preview of the sequence
             self.current_frame = 0
@@ -1901,103 +2660,257 @@ Right-click anywhere for quick access to export options and tools.
         finally:
             self.progress_bar.setVisible(False)
     
-    def show_export_preview(self, pil_image, info_text):
-        """Show preview of exported image."""
-        # Resize for preview (max 256x256)
-        preview_img = pil_image.copy()
-        preview_img.thumbnail((256, 256), Image.Resampling.LANCZOS)
-        
-        # Convert to QPixmap
-        img_array = np.array(preview_img)
-        if len(img_array.shape) == 2:  # Grayscale
-            height, width = img_array.shape
-            qimg = QImage(img_array.data, width, height, width, QImage.Format_Grayscale8)
-        else:  # RGB
-            height, width, channels = img_array.shape
-            qimg = QImage(img_array.data, width, height, width * channels, QImage.Format_RGB888)
+    def export_video(self):
+        """Export animation as an MP4 by piping raw frames to ffmpeg (no per-frame PNGs)."""
+        self.cancel_frame_stack()
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            QMessageBox.warning(self, "Error", "MP4 export needs ffmpeg on the PATH")
+            return
         
-        pixmap = QPixmap.fromImage(qimg)
-        self.export_preview_label.setPixmap(pixmap)
-        self.export_preview_label.setStyleSheet("border: 1px solid #ccc; background: #000;")
+        num_frames = self.frame_spin.value()
+        frame_size = self.atlas_size
+        fps = self.playback_fps_spin.value()
+        
+        # Same base name as the other exports, with a versioned .mp4 extension
+        base = self.output_path.text() or "noise_output"
+        if base.lower().endswith(('.png', '.mp4')):
+            base = base[:-4]
+        filename = f"{base}_v{self.next_version(base, '.mp4'):02d}.mp4"
+        
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setMaximum(100)
+        
+        try:
+            anim_rate = self.anim_rate_spin.value()
+            self.atlas_frames = []
+            self.status_label.setStyleSheet("color: #fa0; font-weight: bold;")
+            
+            # stderr goes to a temp file: an undrained pipe could fill up and stall
+            # ffmpeg (and with it this thread). No console window on Windows builds
+            with tempfile.TemporaryFile() as errors:
+                proc = subprocess.Popen(
+                    [ffmpeg, '-y', '-loglevel', 'error',
+                     '-f', 'rawvideo', '-pix_fmt', 'gray', '-s', f'{frame_size}x{frame_size}', '-r', str(fps),
+                     '-i', '-', '-c:v', 'libx264', '-pix_fmt', 'yuv420p', filename],
+                    stdin=subprocess.PIPE, stderr=errors,
+                    creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0))
+                try:
+                    for i, noise_map in enumerate(self.render_export_frames(num_frames, frame_size, anim_rate)):
+                        self.report_export_progress(i, num_frames, f"Encoding frame {i+1}/{num_frames}...")
+                        img_data = NoiseGenerator.to_uint8(noise_map)
+                        self.atlas_frames.append(self.animation_frame_pixmap(img_data))
+                        proc.stdin.write(img_data)
+                except BrokenPipeError:
+                    pass  # ffmpeg quit early; its error output is reported below
+                except BaseException:
+                    proc.kill()
+                    proc.wait()
+                    raise
+                proc.communicate()
+                if proc.returncode != 0:
+                    errors.seek(0)
+                    message = errors.read().decode(errors='replace').strip()
+                    raise RuntimeError(message or f"ffmpeg exited with code {proc.returncode}")
+            
+            # Start animated preview of the video frames
+            self.current_frame = 0
+            info = f"MP4 Video: {num_frames} frames\nFrame: {frame_size}x{frame_size}\n{os.path.basename(filename)}\n\nPlaying at {fps} FPS"
+            self.export_info_label.setText(info)
+            self.preview_mode_combo.setCurrentText("Anim Preview")
+            self.start_animation()
+            
+            self.progress_bar.setValue(100)
+            self.status_label.setText("Ready")
+            self.status_label.setStyleSheet("color: #0a0; font-weight: bold;")
+            
+            # Update output path to show versioned filename
+            old_manual = self.manual_filename
+            self.output_path.setText(filename)
+            self.manual_filename = old_manual
+            
+            QMessageBox.information(self, "Success", f"Saved video: {filename}\n{num_frames} frames at {fps} FPS\n\nAnimation preview playing!")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to export video: {str(e)}")
+            self.status_label.setText("Ready")
+            self.status_label.setStyleSheet("color: #0a0; font-weight: bold;")
+        finally:
+            self.progress_bar.setVisible(False)
+    
+    def render_export_frames(self, num_frames, frame_size, anim_rate):
+        """Yield the z_offset-animated export frames in order.
+        
+        Frames missing from the composite frame cache are rendered in parallel on
+        worker processes (the opensimplex kernels hold the GIL, so threads wouldn't
+        help), with a bounded number in flight. Falls back to rendering in this
+        process if the pool can't be used.
+        """
+        workers = os.cpu_count() or 1
+        if self._export_pool is None and workers > 1 and num_frames > 1:
+            # spawn, not fork: forking a process with live Qt/Numba threads can deadlock
+            self._export_pool = ProcessPoolExecutor(max_workers=workers,
+                                                    mp_context=multiprocessing.get_context("spawn"),
+                                                    initializer=_init_export_worker)
+        pool = self._export_pool
+        max_in_flight = 2 * workers
+        
+        pending = deque()
+        next_frame = 0
+        while next_frame < num_frames or pending:
+            # Keep the pool fed ahead of the frame being consumed
+            while next_frame < num_frames and len(pending) < max_in_flight:
+                params_a, params_b = self.animated_params(next_frame, anim_rate)
+                key = self.frame_cache_key(params_a, params_b, frame_size, frame_size)
+                frame = self.get_cached_frame(key)
+                future = None
+                if frame is None and pool is not None:
+                    try:
+                        future = pool.submit(_render_frame, self.noise_type_a, self.noise_type_b,
+                                             frame_size, frame_size, params_a, params_b, self.mix_weight, self.blend_mode,
+                                             self.seamless_tiling, self.seamless_blend_width)
+                    except (BrokenProcessPool, RuntimeError):
+                        pool = self._export_pool = None
+                pending.append((key, params_a, params_b, frame, future))
+                next_frame += 1
+            
+            key, params_a, params_b, frame, future = pending.popleft()
+            if frame is None and future is not None:
+                try:
+                    frame = future.result()
+                    self.cache_frame(key, frame)
+                except BrokenProcessPool:
+                    pool = self._export_pool = None
+            if frame is None:
+                frame = self.generate_composite_noise(frame_size, frame_size, params_a, params_b)
+            yield frame
+    
+    def report_export_progress(self, i, num_frames, status=None):
+        """Update export progress at most ~30 times a second.
+        
+        Repaints without processing user input, so parameter changes can't
+        re-enter preview updates mid-export.
+        """
+        now = time.monotonic()
+        if i and now - self._last_progress_update < 1 / 30:
+            return
+        self._last_progress_update = now
+        self.progress_bar.setValue(int((i / num_frames) * 100))
+        if status is not None:
+            self.status_label.setText(status)
+        QApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
+    
+    def show_export_preview(self, img_data, info_text):
+        """Show preview of an exported uint8 image."""
+        # Shrink for preview (max 256x256) with a block-mean box filter
+        img_data = _box_downsample(img_data)
+        pixmap = QPixmap.fromImage(self.gray_qimage(img_data))
+        self.show_export_pixmap(pixmap)
         self.export_info_label.setText(info_text)
     
+    @staticmethod
+    def gray_qimage(img_data):
+        """Wrap a C-contiguous 2D uint8 array as a Grayscale8 QImage without copying.
+        
+        The QImage borrows the array's buffer, so convert it to a pixmap (or scale
+        it) while the array is still alive. Non-contiguous input (e.g. a strided
+        view) would be misread by Qt; it is copied and the image detached.
+        """
+        contiguous = img_data.flags.c_contiguous
+        if not contiguous:
+            img_data = np.ascontiguousarray(img_data)
+        height, width = img_data.shape
+        qimg = QImage(img_data.data, width, height, width, QImage.Format_Grayscale8)
+        return qimg if contiguous else qimg.copy()
+    
+    def show_export_pixmap(self, pixmap):
+        """Show a pixmap in the export preview, switching off the placeholder style once."""
+        if not self._export_preview_styled:
+            self.export_preview_label.setStyleSheet("border: 1px solid #ccc; background: #000;")
+            self._export_preview_styled = True
+        self.export_preview_label.setPixmap(pixmap)
+    
+    def animation_frame_pixmap(self, img_data):
+        """Convert a uint8 frame to a preview-sized pixmap once, so playback only swaps pixmaps."""
+        # The scaled image owns its pixels; img_data can be released
+        return QPixmap.fromImage(_preview_image(img_data))
+    
     def start_animation(self):
         """Start animation playback of atlas frames."""
         if not self.atlas_frames:
             return
         
-        # Stop existing animation if running
-        if self.animation_timer is not None:
-            self.animation_timer.stop()
-        
-        # Create new timer
-        fps = self.playback_fps_spin.value()
-        interval_ms = int(1000 / fps)
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.update_animation_frame)
-        self.animation_timer.start(interval_ms)
+        # Restart the shared timer at the current playback rate
+        self._playback_requested = True
+        self.animation_timer.start(self.playback_interval_ms())
         
         # Show first frame immediately
         self.update_animation_frame()
     
+    def playback_interval_ms(self):
+        """Tick interval for the playback FPS, capped at the display refresh rate.
+        
+        Faster ticks would only swap in frames that are never shown.
+        """
+        fps = self.playback_fps_spin.value()
+        refresh_rate = self.screen().refreshRate()
+        if refresh_rate > 0:
+            fps = min(fps, refresh_rate)
+        return int(1000 / fps)
+    
+    def on_playback_fps_changed(self, value):
+        """Apply a new playback FPS to the running (or next) animation."""
+        self.animation_timer.setInterval(self.playback_interval_ms())
+    
+    def stop_animation(self):
+        """Stop animation playback."""
+        self._playback_requested = False
+        self.animation_timer.stop()
+    
+    def resume_animation(self):
+        """Resume playback paused by hiding or minimizing the window."""
+        if self._playback_requested and not self.animation_timer.isActive():
+            self.animation_timer.start()
+    
     def update_animation_frame(self):
         """Update the export preview with the next animation frame."""
         if not self.atlas_frames:
             return
         
-        # Get current frame
-        frame_data = self.atlas_frames[self.current_frame]
-        height, width = frame_data.shape
-        
-        # Convert to QImage and display
-        qimg = QImage(frame_data.data, width, height, width, QImage.Format_Grayscale8)
-        
-        # Scale to preview size (256x256) maintaining aspect ratio
-        pixmap = QPixmap.fromImage(qimg)
-        scaled_pixmap = pixmap.scaled(256, 256, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        
-        self.export_preview_label.setPixmap(scaled_pixmap)
-        self.export_preview_label.setStyleSheet("border: 1px solid #ccc; background: #000;")
+        # Frames are stored as preview-sized pixmaps
+        self.show_export_pixmap(self.atlas_frames[self.current_frame])
         
         # Advance to next frame (loop)
         self.current_frame = (self.current_frame + 1) % len(self.atlas_frames)
     
+    def resume_sparkles(self):
+        """Schedule the next sparkle if none is pending (after the window was hidden)."""
+        if not self.sparkle_timer.isActive():
+            self.sparkle_timer.start(random.randint(5000, 15000))
+    
     def trigger_sparkle(self):
         """Create sparkle animation with small pixel dots over copyright text."""
-        # Get copyright container position
-        copyright_container = self.findChild(QWidget, "copyright_container")
-        if not copyright_container:
+        # Nobody can see it; showing/restoring the window reschedules
+        if not self.isVisible() or self.isMinimized():
+            self.sparkle_timer.stop()
             return
         
-        # Create 5-15 small pixel dots
-        num_pixels = random.randint(5, 15)
-        self._sparkle_pixels = []
+        # Create 5-15 small pixel dots, painted by the overlay (drawn in one batch)
+        rng = np.random.default_rng()
+        num_pixels = int(rng.integers(5, 16))
+        container_pos = self.copyright_container.mapTo(self, QPoint(0, 0))
         
-        for i in range(num_pixels):
-            # Create small pixel dot
-            pixel = QLabel(self)
-            pixel.setFixedSize(2, 2)
-            pixel.setStyleSheet("background-color: #aaa; border-radius: 1px;")
-            
-            # Random position near copyright text
-            container_pos = copyright_container.mapTo(self, QPoint(0, 0))
-            x_offset = random.randint(-15, 80)
-            y_offset = random.randint(-10, 30)
-            pixel.move(container_pos.x() + x_offset, container_pos.y() + y_offset)
-            
-            # Stagger appearance: random delay 0-700ms
-            appear_delay = random.randint(0, 700)
-            
-            # Stagger disappearance: show for 200-400ms after appearing
-            disappear_delay = appear_delay + random.randint(200, 400)
-            
-            # Schedule appearance
-            QTimer.singleShot(appear_delay, lambda p=pixel: p.show())
-            
-            # Schedule disappearance
-            QTimer.singleShot(disappear_delay, lambda p=pixel: p.deleteLater())
-            
-            self._sparkle_pixels.append(pixel)
+        # Random position near copyright text
+        xs = container_pos.x() + rng.integers(-15, 81, num_pixels)
+        ys = container_pos.y() + rng.integers(-10, 31, num_pixels)
+        
+        # Stagger appearance: random delay 0-700ms
+        appear_delays = rng.integers(0, 701, num_pixels)
+        
+        # Stagger disappearance: show for 200-400ms after appearing
+        disappear_delays = appear_delays + rng.integers(200, 401, num_pixels)
+        
+        self.sparkle_overlay.add_burst(zip(xs.tolist(), ys.tolist(),
+                                           appear_delays.tolist(), disappear_delays.tolist()))
         
         # Schedule next sparkle
         next_delay = random.randint(8000, 15000)
@@ -2005,6 +2918,8 @@ Right-click anywhere for quick access to export options and tools.
 
 
 def main():
+    # Export worker processes re-enter here when running as a frozen executable
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     
     # Set global stylesheet for tooltips - subtle dark style